@@ -1,19 +1,30 @@
 """The Emby Modern component."""
 import logging
 import asyncio
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_API_KEY, CONF_SSL, Platform
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
 import voluptuous as vol
 
-from .const import DOMAIN
-from .coordinator import EmbyDataUpdateCoordinator
+from .const import CONF_SESSION_ENTITY_TTL, DEFAULT_SESSION_ENTITY_TTL, DOMAIN
+from .coordinator import (
+    EmbyLibraryCoordinator,
+    EmbyRuntimeData,
+    EmbyServerCoordinator,
+    EmbySessionCoordinator,
+)
 from .emby_client import EmbyClient, CannotConnect, InvalidAuth
+from .health import Backoff
+from .lifecycle import RETIRE_CHECK_INTERVAL, SessionEntityLifecycle
+from .snapshot import EmbySnapshotStore
+from .transport import PRIORITY_INTERACTIVE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,22 +54,22 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         header = call.data.get("header", "Home Assistant Alert")
         timeout = call.data.get("timeout_ms", 5000)
         
-        # Use the first registered coordinator instance for the client access
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
-        if not coordinator:
+        # Use the first registered server instance for the client access
+        runtime = next(iter(hass.data[DOMAIN].values()), None)
+        if not runtime:
             _LOGGER.error("Cannot send message: No Emby coordinator instance found.")
             return
 
-        client = coordinator.client
-        sessions = coordinator.data.get("sessions", [])
+        client = runtime.client
+        sessions = runtime.sessions.data.get("sessions", [])
         
         params = {"Header": header, "Text": message, "TimeoutMs": timeout}
 
         for session in sessions:
             try:
-                await client.api_request("POST", f"Sessions/{session['Id']}/Message", params=params)
+                await client.api_request("POST", f"Sessions/{session.id}/Message", params=params, priority=PRIORITY_INTERACTIVE)
             except Exception as e:
-                _LOGGER.warning(f"Failed to send message to session {session.get('UserName')}: {e}")
+                _LOGGER.warning(f"Failed to send message to session {session.user_name}: {e}")
 
     # Register the service with the defined schema
     hass.services.async_register(DOMAIN, "send_message", send_message_service, schema=EMBY_SEND_MESSAGE_SCHEMA)
@@ -67,40 +78,65 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Emby Modern from a config entry."""
-    session = async_get_clientsession(hass)
-
-    # 1. Initialize Client 
+    # 1. Initialize Client on HA's shared session; its limiter bounds how many
+    #    requests are in flight, so the pool itself needs no tuning
     client = EmbyClient(
         entry.data[CONF_HOST],
         entry.data[CONF_PORT],
         entry.data[CONF_API_KEY],
         entry.data[CONF_SSL],
         hass.loop,
-        session
+        async_get_clientsession(hass),
+    )
+
+    # 2. Setup Coordinators (one per polling tier)
+    runtime = EmbyRuntimeData(
+        client=client,
+        sessions=EmbySessionCoordinator(hass, client, entry),
+        server=EmbyServerCoordinator(hass, client, entry),
+        libraries=EmbyLibraryCoordinator(hass, client, entry),
+        store=EmbySnapshotStore(hass, entry.entry_id),
+    )
+    runtime.lifecycle = SessionEntityLifecycle(
+        hass,
+        entry,
+        runtime.sessions,
+        timedelta(hours=entry.options.get(CONF_SESSION_ENTITY_TTL, DEFAULT_SESSION_ENTITY_TTL)),
     )
 
-    # 2. Validate Connection
-    try:
-        await client.validate_connection()
-    except (CannotConnect, TimeoutError) as err:
-        raise ConfigEntryNotReady(f"Emby not ready: {err}") from err
-    except InvalidAuth as err:
-        _LOGGER.error(f"Authentication failed: {err}")
-        return False
-    except Exception as err:
-        _LOGGER.error(f"Unexpected error connecting to Emby: {err}")
-        return False
-
-    # 3. Setup Coordinator
-    coordinator = EmbyDataUpdateCoordinator(hass, client, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # 3. Start from the last snapshot if there is one; otherwise wait for the server
+    snapshot = await runtime.store.async_load()
+    if snapshot:
+        client.restore_state(snapshot.get("system_info", {}), snapshot.get("user_id"))
+        runtime.server.async_restore({"system_info": snapshot.get("system_info", {})})
+        runtime.libraries.async_restore({
+            "libraries": snapshot.get("libraries", []),
+            "item_counts": snapshot.get("item_counts", {}),
+        })
+        runtime.sessions.async_restore({"sessions": snapshot.get("sessions", [])})
+        runtime.lifecycle.async_restore(snapshot.get("device_last_seen", {}))
+    else:
+        try:
+            await client.validate_connection()
+        except (CannotConnect, TimeoutError) as err:
+            raise ConfigEntryNotReady(f"Emby not ready: {err}") from err
+        except InvalidAuth as err:
+            raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+        except Exception as err:
+            _LOGGER.error(f"Unexpected error connecting to Emby: {err}")
+            return False
+        await asyncio.gather(
+            *(coordinator.async_config_entry_first_refresh() for coordinator in runtime.coordinators)
+        )
+    runtime.sessions.setup_event_listeners()
+    runtime.libraries.setup_event_listeners()
 
     # 4. Store references
-    entry.runtime_data = coordinator
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.runtime_data = runtime
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime
 
     # 5. Register the Main Device (The Server itself)
-    server_version = coordinator.data.get("system_info", {}).get("Version", "Unknown")
+    server_version = runtime.server.data.get("system_info", {}).get("Version", "Unknown")
     server_name = client.get_server_name() or "Emby Server"
 
     device_identifier = entry.unique_id or entry.entry_id
@@ -142,19 +178,71 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 )
             )
             
-    coordinator.setup_global_listeners(_handle_courtesy_message)
+    runtime.server.setup_global_listeners(_handle_courtesy_message)
+
+    # 8. Reload when options change so new limits take effect
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    # 9. Keep the snapshot current and, when started from it, reconcile with the server
+    store = runtime.store
+    entry.async_on_unload(runtime.server.async_add_listener(lambda: store.async_schedule_save(runtime)))
+    entry.async_on_unload(runtime.libraries.async_add_listener(lambda: store.async_schedule_save(runtime)))
+    entry.async_on_unload(runtime.sessions.async_add_listener(lambda: store.async_sessions_updated(runtime)))
+    if snapshot:
+        entry.async_create_background_task(hass, _async_reconcile(hass, entry, runtime), f"{DOMAIN}_reconcile")
+    else:
+        store.async_schedule_save(runtime)
+
+    # 10. Retire stop buttons and remotes of devices that have been gone too long
+    @callback
+    def _async_retire_stale(_now=None):
+        if runtime.lifecycle.async_retire_stale():
+            store.async_schedule_save(runtime)
+
+    entry.async_on_unload(async_track_time_interval(hass, _async_retire_stale, RETIRE_CHECK_INTERVAL))
+    _async_retire_stale()
 
     return True
 
+async def _async_reconcile(hass: HomeAssistant, entry: ConfigEntry, runtime: EmbyRuntimeData) -> None:
+    """Connect in the background after starting from a snapshot, then refresh every tier."""
+    backoff = Backoff(base=5.0, cap=300.0)
+    while True:
+        try:
+            await runtime.client.validate_connection()
+            break
+        except InvalidAuth as err:
+            _LOGGER.error(f"Authentication failed: {err}")
+            # The snapshot can't be trusted any more: stop showing it and ask for a new key
+            for coordinator in runtime.coordinators:
+                coordinator.last_update_success = False
+                coordinator.async_update_listeners()
+            entry.async_start_reauth(hass)
+            return
+        except Exception as err:
+            delay = backoff.next_delay()
+            _LOGGER.debug(f"Emby not reachable yet ({err}); retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in runtime.coordinators))
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry after its options were changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        await entry.runtime_data.client.async_stop()
         if entry.entry_id in hass.data[DOMAIN]:
             hass.data[DOMAIN].pop(entry.entry_id)
             
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored snapshot along with the entry."""
+    await EmbySnapshotStore(hass, entry.entry_id).async_remove()
+
 # ------------------------------------------------------------------
 #  CRITICAL: DO NOT REMOVE THIS FUNCTION
 #  This allows the user to manually delete old/ghost Emby devices
@@ -1,10 +1,13 @@
 """Support for media browsing."""
 from __future__ import annotations
 from typing import Any
+import asyncio
 import logging
+import string
 from homeassistant.components.media_player import BrowseError, BrowseMedia, MediaClass, MediaType
-from .const import CONTENT_TYPE_MAP, MEDIA_CLASS_MAP, MEDIA_TYPE_NONE, SUPPORTED_COLLECTION_TYPES
+from .const import BROWSE_PAGE_SIZE, CONTENT_TYPE_MAP, MEDIA_CLASS_MAP, MEDIA_TYPE_NONE, SUPPORTED_COLLECTION_TYPES
 from .emby_client import EmbyClient
+from .transport import PRIORITY_BACKGROUND
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,13 +21,28 @@ PLAYABLE_MEDIA_TYPES = [
     MediaType.CHANNEL
 ]
 
-async def async_browse_media(hass, client: EmbyClient, media_content_type: str | None, media_content_id: str | None) -> BrowseMedia:
+# Browse ids look like "<item id>|letter|B|page|2" for paged / bucketed folders
+BROWSE_ID_SEPARATOR = "|"
+# Bucket for names that sort before "A" (digits, punctuation)
+LETTER_OTHER = "#"
+# Bucket for names that sort after "Z" (accented, Cyrillic, CJK, ...); "{" follows both "Z" and "z"
+LETTER_AFTER = "Other"
+LETTER_AFTER_BOUND = "{"
+
+async def async_browse_media(
+    hass,
+    client: EmbyClient,
+    media_content_type: str | None,
+    media_content_id: str | None,
+    page_size: int = BROWSE_PAGE_SIZE,
+    letter_index: bool = False,
+) -> BrowseMedia:
     # Robust check for Root
     if media_content_id in [None, "", "media-source://emby_modern", "root"]:
         return await build_root_response(client)
     
     try:
-        return await build_item_response(client, media_content_type, media_content_id)
+        return await build_item_response(client, media_content_type, media_content_id, page_size, letter_index)
     except Exception as err:
         _LOGGER.error("Error browsing media id '%s': %s", media_content_id, err)
         raise BrowseError(f"Error browsing media: {err}")
@@ -71,7 +89,7 @@ async def item_payload(client: EmbyClient, item: dict[str, Any]) -> BrowseMedia
 
 async def build_root_response(client: EmbyClient) -> BrowseMedia:
     try:
-        folders = await client.get_media_folders()
+        folders = await client.get_media_folders(priority=PRIORITY_BACKGROUND)
         children = []
         if "Items" in folders:
             for folder in folders["Items"]:
@@ -92,11 +110,48 @@ async def build_root_response(client: EmbyClient) -> BrowseMedia:
          _LOGGER.error(f"Failed to build root response: {e}")
          raise BrowseError(f"Failed to build root: {e}")
 
-async def build_item_response(client: EmbyClient, media_content_type: str | None, media_content_id: str) -> BrowseMedia:
+def parse_content_id(media_content_id: str) -> tuple[str, str | None, int]:
+    """Split a browse id into (item id, letter bucket, page number)."""
+    item_id, *parts = media_content_id.split(BROWSE_ID_SEPARATOR)
+    qualifiers = dict(zip(parts[::2], parts[1::2]))
+    try:
+        page = max(int(qualifiers.get("page", 0)), 0)
+    except ValueError:
+        page = 0
+    return item_id, qualifiers.get("letter"), page
+
+def build_content_id(item_id: str, letter: str | None = None, page: int = 0) -> str:
+    parts = [item_id]
+    if letter:
+        parts += ["letter", letter]
+    if page:
+        parts += ["page", str(page)]
+    return BROWSE_ID_SEPARATOR.join(parts)
+
+def _folder_node(title: str, media_content_id: str, media_content_type: str) -> BrowseMedia:
+    """Synthetic node used for letter buckets and "next page" links."""
+    return BrowseMedia(
+        title=title,
+        media_content_id=media_content_id,
+        media_content_type=media_content_type,
+        media_class=MediaClass.DIRECTORY,
+        can_play=False,
+        can_expand=True,
+    )
+
+async def build_item_response(
+    client: EmbyClient,
+    media_content_type: str | None,
+    media_content_id: str,
+    page_size: int = BROWSE_PAGE_SIZE,
+    letter_index: bool = False,
+) -> BrowseMedia:
+    item_id, letter, page = parse_content_id(media_content_id)
+
     # 1. Get details of the folder/item we are clicking
-    item_details = await client.get_item(media_content_id)
+    item_details = await client.get_item(item_id)
     if not item_details:
-        raise BrowseError(f"Media item not found: {media_content_id}")
+        raise BrowseError(f"Media item not found: {item_id}")
 
     title = item_details.get("Name", "Library")
     
@@ -107,35 +162,77 @@ async def build_item_response(client: EmbyClient, media_content_type: str | None
 
     thumbnail = None
     if item_details.get("ImageTags", {}).get("Primary"):
-         thumbnail = client.get_artwork_url(media_content_id)
+         thumbnail = client.get_artwork_url(item_id)
 
-    # 2. Prepare params to fetch children
+    # 2. Prepare params to fetch children (sorted server-side so pages are stable)
     # Default: Sort by Name
-    params = {"ParentId": media_content_id, "SortBy": "SortName", "SortOrder": "Ascending"}
+    params = {"ParentId": item_id, "SortBy": "SortName", "SortOrder": "Ascending"}
+    name_sorted = True
     
     # Special Case: TV Series should sort by Season/Episode (ParentIndex/Index)
     if item_details.get("Type") == "Series":
-         params = {"ParentId": media_content_id} # Emby defaults to season order
-    
-    # 3. Fetch Children
-    children_data = await client.get_items(params)
+         params = {"ParentId": item_id} # Emby defaults to season order
+         name_sorted = False
+
+    if letter == LETTER_OTHER:
+        params["NameLessThan"] = "A"
+    elif letter == LETTER_AFTER:
+        params["NameStartsWithOrGreater"] = LETTER_AFTER_BOUND
+    elif letter:
+        params["NameStartsWith"] = letter
+    if letter:
+        title = f"{title} - {letter}"
+
+    def browse_response(children):
+        return BrowseMedia(
+            media_class=MediaClass.DIRECTORY,
+            media_content_id=media_content_id,
+            media_content_type=str(media_content_type),
+            title=title,
+            can_play=bool(media_content_type in PLAYABLE_MEDIA_TYPES and not letter and not page),
+            can_expand=True,
+            children=children,
+            thumbnail=thumbnail,
+        )
+
+    # 3. Big name-sorted folders can be split into A-Z buckets instead of pages
+    if letter_index and name_sorted and not letter and not page:
+        count_resp, after_resp = await asyncio.gather(
+            client.get_items(params, profile="count", priority=PRIORITY_BACKGROUND),
+            client.get_items(
+                {**params, "NameStartsWithOrGreater": LETTER_AFTER_BOUND}, profile="count", priority=PRIORITY_BACKGROUND
+            ),
+        )
+        if (count_resp or {}).get("TotalRecordCount", 0) > page_size:
+            buckets = [LETTER_OTHER, *string.ascii_uppercase]
+            # Only shown when something is in it, so Latin-only libraries look the same
+            if (after_resp or {}).get("TotalRecordCount", 0):
+                buckets.append(LETTER_AFTER)
+            return browse_response([
+                _folder_node(bucket, build_content_id(item_id, bucket), str(media_content_type))
+                for bucket in buckets
+            ])
+
+    # 4. Fetch one page of children
+    start = page * page_size
+    children_data = await client.get_items(
+        {**params, "StartIndex": start, "Limit": page_size}, profile="browse", priority=PRIORITY_BACKGROUND
+    ) or {}
     children = []
-    
-    if children_data and "Items" in children_data:
-        for child in children_data["Items"]:
-            # FIX: Only append valid children. If item_payload fails (returns None), skip it.
-            payload = await item_payload(client, child)
-            if payload: 
-                children.append(payload)
+    for child in children_data.get("Items") or []:
+        # FIX: Only append valid children. If item_payload fails (returns None), skip it.
+        payload = await item_payload(client, child)
+        if payload: 
+            children.append(payload)
 
-    return BrowseMedia(
-        media_class=MediaClass.DIRECTORY,
-        media_content_id=media_content_id,
-        media_content_type=str(media_content_type),
-        title=title,
-        can_play=bool(media_content_type in PLAYABLE_MEDIA_TYPES),
-        can_expand=True,
-        children=children,
-        thumbnail=thumbnail,
-    )
-    
+    # 5. Link to the next page if there is more
+    total = children_data.get("TotalRecordCount", 0)
+    if start + page_size < total:
+        next_start = start + page_size
+        children.append(_folder_node(
+            f"Next page ({next_start + 1}-{min(next_start + page_size, total)} of {total})",
+            build_content_id(item_id, letter, page + 1),
+            str(media_content_type),
+        ))
+
+    return browse_response(children)
@@ -1,11 +1,11 @@
 """Support for Emby buttons."""
 from __future__ import annotations
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .entity import EmbyEntity
 from .emby_client import CannotConnect
-from .const import IGNORED_CLIENTS
+from .transport import PRIORITY_INTERACTIVE
 
 SERVER_BUTTONS: tuple[ButtonEntityDescription, ...] = (
     ButtonEntityDescription(key="restart", name="Restart", icon="mdi:restart"),
@@ -14,40 +14,23 @@ SERVER_BUTTONS: tuple[ButtonEntityDescription, ...] = (
 )
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddConfigEntryEntitiesCallback) -> None:
-    coordinator = entry.runtime_data
+    runtime = entry.runtime_data
+    coordinator = runtime.sessions
     
     # 1. Server Buttons
-    entities = [EmbyServerButton(coordinator, desc) for desc in SERVER_BUTTONS]
+    entities = [EmbyServerButton(runtime.server, desc) for desc in SERVER_BUTTONS]
     
-    # 2. Dynamic Session Buttons
-    added_sessions = set()
-
-    @callback
-    def _update_session_buttons():
-        sessions = coordinator.data.get("sessions", [])
-        new_buttons = []
-        
-        for session in sessions:
-            session_id = session.get("Id")
-            
-            if session.get("Client") in IGNORED_CLIENTS: continue
-            if not session.get("SupportsRemoteControl", False): continue
-
-            if session_id and session_id not in added_sessions:
-                device_id = session.get("DeviceId") or session_id
-                device_name = session.get("DeviceName") or "Unknown Device"
-                client_name = session.get("Client")
-                
-                new_buttons.append(EmbyKillButton(coordinator, session_id, device_id, device_name, client_name))
-                added_sessions.add(session_id)
-        
-        if new_buttons:
-            async_add_entities(new_buttons)
-
-    entry.async_on_unload(coordinator.async_add_listener(_update_session_buttons))
-    _update_session_buttons()
     async_add_entities(entities)
 
+    # 2. Per-device Stop Session buttons (created, rebound and retired by the lifecycle manager)
+    entry.async_on_unload(runtime.lifecycle.async_register(
+        "button",
+        lambda session, device_id, unique_id: EmbyKillButton(
+            coordinator, session.id, device_id, session.device_name or "Unknown Device", session.client, unique_id
+        ),
+        async_add_entities,
+    ))
+
 class EmbyServerButton(EmbyEntity, ButtonEntity):
     def __init__(self, coordinator, description):
         super().__init__(
@@ -58,32 +41,39 @@ class EmbyServerButton(EmbyEntity, ButtonEntity):
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.entry.unique_id}-{description.key}"
 
+    def _state_fingerprint(self):
+        # Nothing but availability comes from the coordinator
+        return ()
+
     async def async_press(self) -> None:
         if self.entity_description.key == "restart":
-            await self.coordinator.client.api_request("POST", "System/Restart")
+            await self.coordinator.client.api_request("POST", "System/Restart", priority=PRIORITY_INTERACTIVE)
         elif self.entity_description.key == "shutdown":
-            await self.coordinator.client.api_request("POST", "System/Shutdown")
+            await self.coordinator.client.api_request("POST", "System/Shutdown", priority=PRIORITY_INTERACTIVE)
         elif self.entity_description.key == "scan":
-            await self.coordinator.client.api_request("POST", "Library/Refresh")
+            await self.coordinator.client.api_request("POST", "Library/Refresh", priority=PRIORITY_INTERACTIVE)
 
 class EmbyKillButton(EmbyEntity, ButtonEntity):
     _attr_name = "Stop Session"
     _attr_icon = "mdi:stop-circle-outline"
 
-    def __init__(self, coordinator, session_id, device_id, device_name, client_name):
+    def __init__(self, coordinator, session_id, device_id, device_name, client_name, unique_id):
         super().__init__(coordinator, device_id, device_name, client_name)
+        # Rebound by the lifecycle manager when the device starts a new session
         self.session_id = session_id
-        self._attr_unique_id = f"kill-{session_id}"
+        self._attr_unique_id = unique_id
 
     @property
     def available(self) -> bool:
-        current_ids = [s["Id"] for s in self.coordinator.data.get("sessions", [])]
-        return self.session_id in current_ids
+        return self.coordinator.get_session(self.session_id) is not None
+
+    def _state_fingerprint(self):
+        return ()
 
     async def async_press(self) -> None:
         try:
-            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing/Stop")
-            await self.coordinator.client.api_request("DELETE", f"Sessions/{self.session_id}")
+            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing/Stop", priority=PRIORITY_INTERACTIVE)
+            await self.coordinator.client.api_request("DELETE", f"Sessions/{self.session_id}", priority=PRIORITY_INTERACTIVE)
         except CannotConnect:
             pass
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_session_refresh(self.session_id)
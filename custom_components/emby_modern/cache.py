@@ -0,0 +1,101 @@
+"""Response cache for the Emby client."""
+from __future__ import annotations
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+# Returned by get() on a miss, since None is a valid cached response
+MISS = object()
+
+
+class ResponseCache:
+    """Bounded TTL + LRU cache for GET responses.
+
+    TTLs are chosen per endpoint by the first matching regex rule; endpoints with no
+    rule are never cached. Entries are evicted least-recently-used first once either
+    the entry count or the total payload size goes over its cap.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttl_rules: Iterable[tuple[str, float]], max_entries: int = 512, max_bytes: int = 4 * 1024 * 1024):
+        self._rules = [(re.compile(pattern), ttl) for pattern, ttl in ttl_rules]
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        # key -> (expires_at, size, value)
+        self._entries: OrderedDict[tuple, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict | None) -> tuple:
+        """Build a key that ignores parameter order and value types."""
+        normalized = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (endpoint, normalized)
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        for pattern, ttl in self._rules:
+            if pattern.match(endpoint):
+                return ttl
+        return None
+
+    def get(self, key: tuple) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISS
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return MISS
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: Any, ttl: float, size: int) -> None:
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._bytes += size
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, pattern: str) -> int:
+        """Drop every entry whose endpoint matches the regex; returns how many were dropped."""
+        regex = re.compile(pattern)
+        stale = [key for key in self._entries if regex.match(key[0])]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: tuple) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
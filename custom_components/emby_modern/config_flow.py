@@ -2,18 +2,36 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 from urllib.parse import urlparse
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_API_KEY, CONF_SSL
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.ssdp import SsdpServiceInfo
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_BROWSE_LETTER_INDEX,
+    CONF_EPG_WINDOW_HOURS,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_PUSH_SCAN_INTERVAL,
+    CONF_SESSION_ENTITY_TTL,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_BROWSE_LETTER_INDEX,
+    DEFAULT_EPG_WINDOW_HOURS,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PUSH_SCAN_INTERVAL,
+    DEFAULT_SESSION_ENTITY_TTL,
+)
 from .emby_client import EmbyClient, CannotConnect, InvalidAuth
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +46,12 @@ class EmbyConfigFlow(ConfigFlow, domain=DOMAIN):
         self._discovered_host: str | None = None
         self._discovered_port: int = 8096
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return EmbyOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -97,6 +121,9 @@ class EmbyConfigFlow(ConfigFlow, domain=DOMAIN):
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception: %s", err)
                 errors["base"] = "unknown"
+            finally:
+                # Only a probe: stop the WebSocket that validation started
+                await client.async_stop()
 
         # Define schema with defaults (using discovered values if available)
         schema = vol.Schema(
@@ -115,6 +142,47 @@ class EmbyConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors
         )
 
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
+        """The server rejected the stored API key."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for a new API key and check it against the same server."""
+        errors: dict[str, str] = {}
+        entry = self._get_reauth_entry()
+
+        if user_input is not None:
+            client = EmbyClient(
+                entry.data[CONF_HOST],
+                entry.data[CONF_PORT],
+                user_input[CONF_API_KEY],
+                entry.data[CONF_SSL],
+                self.hass.loop,
+                async_get_clientsession(self.hass),
+            )
+            try:
+                await client.validate_connection()
+                return self.async_update_reload_and_abort(
+                    entry, data_updates={CONF_API_KEY: user_input[CONF_API_KEY]}
+                )
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception: %s", err)
+                errors["base"] = "unknown"
+            finally:
+                await client.async_stop()
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_API_KEY): str}),
+            errors=errors,
+        )
+
     async def async_step_ssdp(self, discovery_info: SsdpServiceInfo) -> FlowResult:
         """Handle SSDP discovery."""
         # 1. Parse the Unique ID (UDN)
@@ -146,3 +214,50 @@ class EmbyConfigFlow(ConfigFlow, domain=DOMAIN):
 
         # 5. Redirect to the User Form
         return await self.async_step_user()
+
+
+class EmbyOptionsFlow(OptionsFlow):
+    """Handle Emby Modern options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                vol.Optional(
+                    CONF_BROWSE_LETTER_INDEX,
+                    default=options.get(CONF_BROWSE_LETTER_INDEX, DEFAULT_BROWSE_LETTER_INDEX),
+                ): bool,
+                vol.Optional(
+                    CONF_ACTIVE_SCAN_INTERVAL,
+                    default=options.get(CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=2, max=60)),
+                vol.Optional(
+                    CONF_IDLE_SCAN_INTERVAL,
+                    default=options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(
+                    CONF_PUSH_SCAN_INTERVAL,
+                    default=options.get(CONF_PUSH_SCAN_INTERVAL, DEFAULT_PUSH_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+                vol.Optional(
+                    CONF_EPG_WINDOW_HOURS,
+                    default=options.get(CONF_EPG_WINDOW_HOURS, DEFAULT_EPG_WINDOW_HOURS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=2, max=48)),
+                vol.Optional(
+                    CONF_SESSION_ENTITY_TTL,
+                    default=options.get(CONF_SESSION_ENTITY_TTL, DEFAULT_SESSION_ENTITY_TTL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=2160)),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -1,9 +1,42 @@
 """Constants for the Emby Modern integration."""
+from datetime import timedelta
+
 from homeassistant.components.media_player import MediaClass, MediaType
 
 DOMAIN = "emby_modern"
 CONF_CLIENT_DEVICE_ID = "client_device_id"
 
+# Polling tiers
+# Sessions start here, then adapt to activity (see the session poll options below)
+SESSION_SCAN_INTERVAL = timedelta(seconds=10)
+SERVER_SCAN_INTERVAL = timedelta(minutes=5)
+LIBRARY_SCAN_INTERVAL = timedelta(minutes=30)
+
+# Emby reports times and positions in 100 ns ticks
+TICKS_PER_SECOND = 10_000_000
+
+# Media browser: children per page
+BROWSE_PAGE_SIZE = 100
+
+# Options
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+CONF_BROWSE_LETTER_INDEX = "browse_letter_index"
+DEFAULT_BROWSE_LETTER_INDEX = False
+# Session polling, in seconds: nothing playing / something playing / WebSocket up
+CONF_IDLE_SCAN_INTERVAL = "idle_scan_interval"
+DEFAULT_IDLE_SCAN_INTERVAL = 120
+CONF_ACTIVE_SCAN_INTERVAL = "active_scan_interval"
+DEFAULT_ACTIVE_SCAN_INTERVAL = 5
+CONF_PUSH_SCAN_INTERVAL = "push_scan_interval"
+DEFAULT_PUSH_SCAN_INTERVAL = 300
+# Hours of Live TV guide kept locally
+CONF_EPG_WINDOW_HOURS = "epg_window_hours"
+DEFAULT_EPG_WINDOW_HOURS = 12
+# Hours a device may be gone before its media player, stop button and remote are deleted
+CONF_SESSION_ENTITY_TTL = "session_entity_ttl"
+DEFAULT_SESSION_ENTITY_TTL = 168
+
 # Needed for browse_media.py to skip ignored devices
 IGNORED_CLIENTS = [] 
 
@@ -1,121 +1,798 @@
-"""Data update coordinator."""
+"""Data update coordinators.
+
+Polling is split into tiers so fast-changing data does not drag slow data along:
+- Sessions drive media players, remotes and session buttons. They are pushed over the
+  WebSocket when it is up; otherwise polling speeds up while something is playing and
+  backs off while the server is idle.
+- Server info (System/Info) refreshes slowly.
+- Library statistics refresh rarely, or as soon as the server reports a library change.
+"""
 from __future__ import annotations
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from .emby_client import EmbyClient
+from homeassistant.util import dt as dt_util
+from .const import (
+    CONF_ACTIVE_SCAN_INTERVAL,
+    CONF_EPG_WINDOW_HOURS,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_PUSH_SCAN_INTERVAL,
+    DEFAULT_ACTIVE_SCAN_INTERVAL,
+    DEFAULT_EPG_WINDOW_HOURS,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PUSH_SCAN_INTERVAL,
+    LIBRARY_SCAN_INTERVAL,
+    SERVER_SCAN_INTERVAL,
+    SESSION_SCAN_INTERVAL,
+)
+from .emby_client import CannotConnect, EmbyClient
+from .epg import GuideCache
+from .lifecycle import SessionEntityLifecycle
+from .models import EmbyItem, EmbySession
+from .snapshot import EmbySnapshotStore
+from .transport import PRIORITY_BACKGROUND
 from homeassistant.core import callback # ADDED: Required for event handlers
 
 _LOGGER = logging.getLogger(__name__)
 
-class EmbyDataUpdateCoordinator(DataUpdateCoordinator):
-    """Emby Data Update Coordinator."""
+# Library scans fire bursts of LibraryChanged events; coalesce them into one refresh
+LIBRARY_REFRESH_COOLDOWN = 30
+# Give the server a moment to apply a command before confirming it
+SESSION_REFRESH_COOLDOWN = 1
+# After a session change, keep polling fast for this long even if nothing is playing
+SESSION_CHANGE_FAST_POLL = 60
+# Events that mean the session list just changed
+SESSION_CHANGE_EVENTS = ("PlaybackStart", "PlaybackStopped", "SessionEnded")
+# A connected socket that has not pushed sessions for this long is not trusted
+SESSION_PUSH_STALE_AFTER = 30
+
+# Server-wide Items/Counts fields, by sensor attribute name
+LIBRARY_COUNT_FIELDS = {
+    "movie_count": "MovieCount",
+    "series_count": "SeriesCount",
+    "episode_count": "EpisodeCount",
+    "song_count": "SongCount",
+}
+# Per-library breakdowns (Items/Counts cannot be scoped), by sensor attribute name and item type
+LIBRARY_TYPE_COUNTS = {
+    "movie_count": "Movie",
+    "series_count": "Series",
+    "episode_count": "Episode",
+    "song_count": "Audio",
+}
+# Which breakdowns each kind of library can have; others (photos, books, ...) get none
+COLLECTION_TYPE_COUNTS = {
+    "movies": ("movie_count",),
+    "tvshows": ("series_count", "episode_count"),
+    "music": ("song_count",),
+    "mixed": tuple(LIBRARY_TYPE_COUNTS),
+    "unknown": tuple(LIBRARY_TYPE_COUNTS),
+}
+# Library sensors show this many newest items
+LATEST_ITEMS_WINDOW = 5
+LATEST_ITEM_TYPES = "Movie,Series,Episode,Audio,Video"
+# Incremental "latest" queries return at most this many items; hitting it means reseed
+LATEST_INCREMENTAL_LIMIT = 50
+# The Live TV sensor shows now/next for this many channels; the full guide stays in GuideCache
+LIVE_TV_SENSOR_CHANNELS = 30
+
+POLL_MODE_PUSH = "push"
+POLL_MODE_ACTIVE = "active"
+POLL_MODE_IDLE = "idle"
+
+class EmbyDataUpdateCoordinator(DataUpdateCoordinator, ABC):
+    """Base class for the Emby coordinator tiers."""
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass, client: EmbyClient, entry: ConfigEntry) -> None:
+    def __init__(self, hass, client: EmbyClient, entry: ConfigEntry, name: str, update_interval: timedelta, **kwargs) -> None:
         self.client = client
         self.entry = entry
+        # Bounds how many requests a single refresh keeps in flight at once
+        self._request_limit = asyncio.Semaphore(
+            entry.options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
+        )
         super().__init__(
-            hass, _LOGGER, name="Emby Data", update_interval=timedelta(seconds=10),
+            hass, _LOGGER, config_entry=entry, name=name, update_interval=update_interval, **kwargs
         )
 
+        # Bumped whenever listeners are told about new data; entities memoize per generation
+        self.generation = 0
+        # Refresh timing, exposed through diagnostics
+        self._cycles = 0
+        self._cycle_total = 0.0
+        self._cycle_max = 0.0
+        self._cycle_last = None
+
     async def _async_update_data(self):
+        started = time.perf_counter()
         try:
-            # 1. Fetch Basic Data
-            sessions = await self.client.api_request("GET", "Sessions")
-            system_info = await self.client.api_request("GET", "System/Info")
-            
-            libraries = []
-            folders = await self.client.get_media_folders()
-            
-            # 2. Process Libraries
-            if folders and "Items" in folders:
-                for item in folders["Items"]:
-                    col_type = item.get("CollectionType", "unknown")
-                    
-                    # --- A. LIVE TV LOGIC ---
-                    if col_type == "livetv":
-                        # Fetch Channels with Current Program Info
-                        channels_resp = await self.client.api_request(
-                            "GET", 
-                            "LiveTv/Channels", 
-                            params={"Limit": 30, "EnableImages": "false"} 
-                        )
-                        
-                        channel_data = []
-                        if channels_resp and "Items" in channels_resp:
-                            for ch in channels_resp["Items"]:
-                                name = ch.get("Name", "Unknown")
-                                # Try to get current program
-                                prog = ch.get("CurrentProgram", {}).get("Name", "Off Air")
-                                channel_data.append({"name": name, "program": prog})
-
-                        libraries.append({
-                            "Id": item["Id"],
-                            "Name": item["Name"],
-                            "Type": col_type,
-                            "Count": channels_resp.get("TotalRecordCount", 0) if channels_resp else 0,
-                            "LatestItems": channel_data 
-                        })
-
-                    # --- B. STANDARD MEDIA LOGIC (Movies, TV, etc) ---
-                    else:
-                        # Get Total Count
-                        count_resp = await self.client.get_items(
-                            params={
-                                "ParentId": item["Id"], 
-                                "Recursive": "true", 
-                                "IncludeItemTypes": "Movie,Series,Episode,Audio,Video", 
-                                "Limit": 0
-                            }
-                        )
-                        
-                        # Get Latest Items
-                        latest_resp = await self.client.get_items(
-                            params={
-                                "ParentId": item["Id"], 
-                                "Recursive": "true", 
-                                "Limit": 5, 
-                                "SortBy": "DateCreated", 
-                                "SortOrder": "Descending", 
-                                "IncludeItemTypes": "Movie,Series,Episode,Audio,Video"
-                            }
-                        )
-                        
-                        latest_items = []
-                        if latest_resp and "Items" in latest_resp:
-                            # FIX: Pass the full dictionary object so sensor.py can format it
-                            latest_items = latest_resp["Items"]
-
-                        libraries.append({
-                            "Id": item["Id"],
-                            "Name": item["Name"],
-                            "Type": col_type,
-                            "Count": count_resp.get("TotalRecordCount", 0),
-                            "LatestItems": latest_items
-                        })
+            return await self._async_fetch()
+        finally:
+            elapsed = time.perf_counter() - started
+            self._cycles += 1
+            self._cycle_total += elapsed
+            self._cycle_max = max(self._cycle_max, elapsed)
+            self._cycle_last = elapsed
 
-            return {
-                "sessions": sessions or [], 
-                "libraries": libraries,
-                "system_info": system_info or {}
-            }
-            
+    @abstractmethod
+    async def _async_fetch(self):
+        """Fetch this tier's data."""
+
+    @property
+    def cycle_stats(self) -> dict:
+        return {
+            "update_interval": self.update_interval.total_seconds() if self.update_interval else None,
+            "last_update_success": self.last_update_success,
+            "cycles": self._cycles,
+            "last_ms": round(self._cycle_last * 1000, 1) if self._cycle_last is not None else None,
+            "avg_ms": round(self._cycle_total / self._cycles * 1000, 1) if self._cycles else None,
+            "max_ms": round(self._cycle_max * 1000, 1),
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        self.generation += 1
+        super().async_update_listeners()
+
+    @callback
+    def async_restore(self, data: dict, available: bool = True) -> None:
+        """Start from stored data instead of a first refresh; the next poll reconciles it."""
+        self.data = data
+        self.last_update_success = available
+        self.generation += 1
+
+    async def _limited(self, coro):
+        """Await a request while holding a concurrency slot."""
+        async with self._request_limit:
+            return await coro
+
+
+class EmbySessionCoordinator(EmbyDataUpdateCoordinator):
+    """Fast tier: active sessions.
+
+    The polling interval follows what is going on:
+    - push:   the WebSocket is up and pushes sessions; HTTP is only a rare safety net
+    - active: something is playing, or a session changed in the last minute
+    - idle:   nothing is playing, so poll every few minutes
+    """
+
+    def __init__(self, hass, client: EmbyClient, entry: ConfigEntry) -> None:
+        super().__init__(hass, client, entry, "Emby Sessions", SESSION_SCAN_INTERVAL)
+        # Sessions touched by commands, confirmed in one batch after a short cooldown
+        self._pending_session_ids: set[str] = set()
+        self._session_refresh_debouncer = Debouncer(
+            hass, _LOGGER, cooldown=SESSION_REFRESH_COOLDOWN, immediate=False,
+            function=self._async_refresh_pending_sessions,
+        )
+
+        options = entry.options
+        self._intervals = {
+            POLL_MODE_PUSH: timedelta(seconds=options.get(CONF_PUSH_SCAN_INTERVAL, DEFAULT_PUSH_SCAN_INTERVAL)),
+            POLL_MODE_ACTIVE: timedelta(seconds=options.get(CONF_ACTIVE_SCAN_INTERVAL, DEFAULT_ACTIVE_SCAN_INTERVAL)),
+            POLL_MODE_IDLE: timedelta(seconds=options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL)),
+        }
+        self._poll_mode = None
+        self._fast_until = 0.0
+        self._last_push = 0.0
+        self._session_signature = None
+        # session Id -> when a PlaybackProgress event last corrected its position
+        self.position_reports: dict[str, datetime] = {}
+
+    @callback
+    def setup_event_listeners(self):
+        """Feed pushed session lists straight into the coordinator."""
+        self.config_entry.async_on_unload(
+            self.client.add_message_listener("Sessions", self._handle_sessions_push)
+        )
+        self.config_entry.async_on_unload(
+            self.client.add_connection_listener(self._handle_connection_change)
+        )
+        for event_name in SESSION_CHANGE_EVENTS:
+            self.config_entry.async_on_unload(
+                self.client.add_message_listener(event_name, self._handle_session_event)
+            )
+        self.config_entry.async_on_unload(
+            self.client.add_message_listener("PlaybackProgress", self._handle_playback_progress)
+        )
+        self._update_poll_mode()
+
+    @callback
+    def _handle_sessions_push(self, data):
+        sessions = data.get("Data")
+        if isinstance(sessions, list):
+            self._last_push = time.monotonic()
+            data = self._build_data(self._parse_sessions(sessions))
+            self._track_activity(data["sessions"])
+            self.async_set_updated_data(data)
+
+    @callback
+    def _handle_connection_change(self, connected: bool):
+        self._update_poll_mode()
+        if not connected:
+            # Socket dropped: catch up on what we missed
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_session_event(self, data):
+        self._snap_to_fast()
+        if self.client.ws_connected and time.monotonic() - self._last_push > SESSION_PUSH_STALE_AFTER:
+            # Connected, but the session pushes have stopped: fetch instead
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_playback_progress(self, data):
+        """Correct one session's position in place; the list itself has not changed."""
+        payload = data.get("Data")
+        if not isinstance(payload, dict):
+            return
+        session = self.get_session(payload.get("SessionId") or payload.get("Id"))
+        if session is None:
+            return
+        # Sent either as a session (with PlayState) or as flat progress info
+        ticks = (payload.get("PlayState") or payload).get("PositionTicks")
+        if ticks is None:
+            return
+        session.position_ticks = ticks
+        self.position_reports[session.id] = dt_util.utcnow()
+        self.async_update_listeners()
+
+    def _track_activity(self, sessions: list[EmbySession]) -> None:
+        """Note whether the session list changed and pick the next interval."""
+        signature = frozenset(
+            (s.id, s.now_playing.id if s.now_playing else None, s.is_paused)
+            for s in sessions
+        )
+        if self._session_signature is not None and signature != self._session_signature:
+            self._fast_until = time.monotonic() + SESSION_CHANGE_FAST_POLL
+        self._session_signature = signature
+        for gone in self.position_reports.keys() - {s.id for s in sessions}:
+            del self.position_reports[gone]
+        self._update_poll_mode(any(s.is_playing for s in sessions))
+
+    def _update_poll_mode(self, playing: bool | None = None) -> None:
+        if playing is None:
+            playing = any(s.is_playing for s in (self.data or {}).get("sessions", []))
+        if self.client.ws_connected:
+            mode = POLL_MODE_PUSH
+        elif playing or time.monotonic() < self._fast_until:
+            mode = POLL_MODE_ACTIVE
+        else:
+            mode = POLL_MODE_IDLE
+        if mode != self._poll_mode:
+            _LOGGER.debug(f"Session polling: {self._poll_mode} -> {mode}")
+            self._poll_mode = mode
+        self.update_interval = self._intervals[mode]
+
+    @callback
+    def _snap_to_fast(self, refresh: bool = True) -> None:
+        """A session changed: poll fast for a while, starting now if we were idle."""
+        self._fast_until = time.monotonic() + SESSION_CHANGE_FAST_POLL
+        was_idle = self._poll_mode == POLL_MODE_IDLE
+        self._update_poll_mode()
+        if refresh and was_idle and self._poll_mode == POLL_MODE_ACTIVE:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @property
+    def cycle_stats(self) -> dict:
+        return {**super().cycle_stats, "poll_mode": self._poll_mode}
+
+    @callback
+    def async_restore(self, data: dict, available: bool = False) -> None:
+        # Stored sessions only say which devices exist; they stay unavailable until confirmed
+        super().async_restore(self._build_data(self._parse_sessions(data.get("sessions", []))), available)
+
+    async def _async_fetch(self):
+        try:
+            sessions = await self.client.api_request("GET", "Sessions")
         except Exception as err:
             # IMPORTANT: Re-raising the error here allows the sensor/switch to mark the server as UNAVAILABLE
             raise UpdateFailed(f"Error communicating with API: {err}")
 
-    async def async_connect(self) -> None:
-        await self.client.validate_connection()
-        await self.async_config_entry_first_refresh()
-        
+        data = self._build_data(self._parse_sessions(sessions or []))
+        self._track_activity(data["sessions"])
+        return data
+
+    @staticmethod
+    def _parse_sessions(sessions: list) -> list[EmbySession]:
+        """Keep only what the platforms read; the raw JSON is dropped."""
+        return [EmbySession.from_api(s) for s in sessions if isinstance(s, dict)]
+
+    @staticmethod
+    def _build_data(sessions: list[EmbySession]) -> dict:
+        """Wrap a session list with lookup indexes built once per refresh."""
+        by_id = {}
+        by_device = {}
+        for session in sessions:
+            # setdefault keeps the first match, same as a linear scan would
+            if session.id:
+                by_id.setdefault(session.id, session)
+            if session.device_id:
+                by_device.setdefault(session.device_id, session)
+        return {"sessions": sessions, "sessions_by_id": by_id, "sessions_by_device": by_device}
+
+    async def async_request_session_refresh(self, session_id: str | None) -> None:
+        """Confirm a single session's state after a command was sent to it.
+
+        With the WebSocket up the server pushes the change on its own, so nothing is
+        fetched. Otherwise only the affected sessions are re-read, debounced so a burst
+        of commands costs one request per session.
+        """
+        if not session_id or self.client.ws_connected:
+            return
+        # The targeted refresh below reschedules polling at the fast interval
+        self._snap_to_fast(refresh=False)
+        self._pending_session_ids.add(session_id)
+        await self._session_refresh_debouncer.async_call()
+
+    async def async_shutdown(self) -> None:
+        self._session_refresh_debouncer.async_cancel()
+        await super().async_shutdown()
+
+    async def _async_refresh_pending_sessions(self) -> None:
+        session_ids, self._pending_session_ids = self._pending_session_ids, set()
+        if not session_ids or not self.data:
+            return
+
+        session_ids = list(session_ids)
+        results = await asyncio.gather(
+            *(self.client.api_request("GET", "Sessions", params={"Id": sid}) for sid in session_ids),
+            return_exceptions=True,
+        )
+
+        fresh = {}
+        for sid, result in zip(session_ids, results):
+            if isinstance(result, Exception):
+                _LOGGER.debug(f"Targeted refresh of session {sid} failed: {result}")
+                continue
+            if not isinstance(result, list):
+                # An error response (None) says nothing about the session; keep it
+                _LOGGER.debug(f"Targeted refresh of session {sid} got no session list")
+                continue
+            # The session is gone (e.g. stopped) if the server no longer returns it
+            fresh[sid] = next(
+                (EmbySession.from_api(s) for s in result if s.get("Id") == sid), None
+            )
+        if not fresh:
+            return
+
+        sessions = []
+        for session in self.data["sessions"]:
+            sid = session.id
+            if sid not in fresh:
+                sessions.append(session)
+            elif fresh[sid] is not None:
+                sessions.append(fresh.pop(sid))
+            else:
+                fresh.pop(sid)
+        # Sessions that were not known yet
+        sessions.extend(s for s in fresh.values() if s is not None)
+
+        data = self._build_data(sessions)
+        self._track_activity(data["sessions"])
+        self.async_set_updated_data(data)
+
+    def get_session(self, session_id: str) -> EmbySession | None:
+        """Return the live session with this Id, if any."""
+        return self.data.get("sessions_by_id", {}).get(session_id)
+
+    def get_device_session(self, device_id: str) -> EmbySession | None:
+        """Return the live session for a device (falls back to matching a session Id)."""
+        return (
+            self.data.get("sessions_by_device", {}).get(device_id)
+            or self.data.get("sessions_by_id", {}).get(device_id)
+        )
+
+
+class EmbyServerCoordinator(EmbyDataUpdateCoordinator):
+    """Slow tier: server information (version, name)."""
+
+    def __init__(self, hass, client: EmbyClient, entry: ConfigEntry) -> None:
+        super().__init__(hass, client, entry, "Emby Server", SERVER_SCAN_INTERVAL)
+
+    async def _async_fetch(self):
+        try:
+            system_info = await self.client.get_system_info()
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}")
+
+        return {"system_info": system_info or {}}
+
     @callback
     def setup_global_listeners(self, courtesy_callback):
         """Register WebSocket listeners directly on the client for global events."""
-        
+
         # This fixes the AttributeError from __init__.py by correctly calling the listener method
         # on the client object, which the coordinator manages.
-        self.client.add_message_listener("ServerShuttingDown", courtesy_callback)
-        self.client.add_message_listener("ServerRestarting", courtesy_callback)
+        for event_name in ("ServerShuttingDown", "ServerRestarting"):
+            self.config_entry.async_on_unload(
+                self.client.add_message_listener(event_name, courtesy_callback)
+            )
+
+
+class EmbyLibraryCoordinator(EmbyDataUpdateCoordinator):
+    """Very slow tier: library counts, latest items and Live TV channels.
+
+    Each library's count and per-type breakdown, and the server-wide per-type
+    counts from Items/Counts, are kept until a library changes. Latest
+    items are tracked per library with a DateCreated high-water mark: after the
+    first fetch only items saved since the mark are requested and merged into a
+    small local window. While the WebSocket is up and no LibraryChanged event has
+    arrived, neither is requested at all.
+
+    Live TV now/next comes from a local guide that is downloaded a window at a time
+    and re-read at each program boundary, without asking the server.
+    """
+
+    def __init__(self, hass, client: EmbyClient, entry: ConfigEntry) -> None:
+        super().__init__(
+            hass, client, entry, "Emby Libraries", LIBRARY_SCAN_INTERVAL,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=LIBRARY_REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+        self._counts: dict[str, int] = {}
+        self._type_counts: dict[str, dict[str, int]] = {}
+        self._item_counts: dict[str, int] | None = None
+        self._latest: dict[str, list[EmbyItem]] = {}
+        self._watermarks: dict[str, str] = {}
+        self._guide = GuideCache()
+        self._guide_window = entry.options.get(CONF_EPG_WINDOW_HOURS, DEFAULT_EPG_WINDOW_HOURS) * 3600
+        self._guide_unsub = None
+        # A library may have changed (re-count, check for new items) / lost items (fetch latest from scratch)
+        self._dirty = True
+        self._reseed = False
+
+    @callback
+    def setup_event_listeners(self):
+        """Refresh library statistics when the server reports a change."""
+        self.config_entry.async_on_unload(
+            self.client.add_message_listener("LibraryChanged", self._handle_library_changed)
+        )
+        self.config_entry.async_on_unload(
+            self.client.add_connection_listener(self._handle_connection_change)
+        )
+
+    @callback
+    def _handle_library_changed(self, data):
+        changes = data.get("Data") or {}
+        self._dirty = True
+        if changes.get("ItemsRemoved") or changes.get("FoldersRemovedFrom"):
+            self._reseed = True
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_connection_change(self, connected: bool):
+        # Events may have been missed while the socket was down
+        self._dirty = True
+
+    async def _async_fetch(self):
+        try:
+            folders = await self._limited(self.client.get_media_folders(priority=PRIORITY_BACKGROUND))
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with API: {err}")
+
+        # Without the socket there are no LibraryChanged events to rely on
+        changed = self._dirty or not self.client.ws_connected
+        reseed = self._reseed
+        self._dirty = self._reseed = False
+
+        # Process libraries and the server-wide counts concurrently; a failing
+        # sub-fetch never fails the whole update
+        libraries = []
+        folder_items = (folders or {}).get("Items") or []
+        item_counts, *results = await asyncio.gather(
+            self._async_item_counts(changed),
+            *(self._async_fetch_library(item, changed, reseed) for item in folder_items),
+            return_exceptions=True,
+        )
+        if isinstance(item_counts, BaseException):
+            if isinstance(item_counts, asyncio.CancelledError):
+                raise item_counts
+            _LOGGER.warning(f"Failed to update item counts: {item_counts}")
+            item_counts = self._item_counts or {}
+            self._dirty = True
+
+        if not folder_items:
+            # No answer (or a user without libraries for now): keep the libraries we know,
+            # since library sensors are only created at setup from this list
+            self._dirty = True
+            libraries = (self.data or {}).get("libraries", [])
+        else:
+            for item, result in zip(folder_items, results):
+                if isinstance(result, BaseException):
+                    if isinstance(result, asyncio.CancelledError):
+                        raise result
+                    _LOGGER.warning(f"Failed to update library {item.get('Name')}: {result}")
+                    result = self._previous_library(item)
+                    self._dirty = True
+                libraries.append(result)
+
+            # Forget libraries that no longer exist
+            current = {item["Id"] for item in folder_items}
+            for library_id in set(self._latest) - current:
+                self._latest.pop(library_id)
+                self._watermarks.pop(library_id, None)
+            for library_id in set(self._counts) - current:
+                self._counts.pop(library_id)
+            for library_id in set(self._type_counts) - current:
+                self._type_counts.pop(library_id)
+
+        self._schedule_guide_update()
+        return {"libraries": libraries, "item_counts": item_counts}
+
+    @callback
+    def _schedule_guide_update(self) -> None:
+        """Wake up when the next program starts or ends."""
+        if self._guide_unsub:
+            self._guide_unsub()
+            self._guide_unsub = None
+        boundary = self._guide.next_boundary(time.time())
+        if boundary is not None:
+            self._guide_unsub = async_track_point_in_utc_time(
+                self.hass, self._handle_program_boundary, datetime.fromtimestamp(boundary, timezone.utc)
+            )
+
+    @callback
+    def _handle_program_boundary(self, _now) -> None:
+        self._guide_unsub = None
+        if self.data:
+            snapshot = self._guide.snapshot(time.time(), LIVE_TV_SENSOR_CHANNELS)
+            self.data = {
+                **self.data,
+                "libraries": [
+                    {**lib, "LatestItems": snapshot} if lib["Type"] == "livetv" else lib
+                    for lib in self.data["libraries"]
+                ],
+            }
+            # Listeners only: setting data through async_set_updated_data would push back the next poll
+            self.async_update_listeners()
+        self._schedule_guide_update()
+
+    async def async_shutdown(self) -> None:
+        if self._guide_unsub:
+            self._guide_unsub()
+            self._guide_unsub = None
+        await super().async_shutdown()
+
+    @property
+    def cycle_stats(self) -> dict:
+        return {**super().cycle_stats, "guide": self._guide.stats}
+
+    @callback
+    def async_restore(self, data: dict, available: bool = True) -> None:
+        # Seed counts and latest-item windows so the first poll only checks for changes
+        if data.get("item_counts"):
+            self._item_counts = data["item_counts"]
+        for lib in data.get("libraries", []):
+            if lib.get("Type") == "livetv":
+                # Stored now/next is stale; the guide is loaded on the first poll
+                lib["LatestItems"] = []
+                continue
+            if "Count" in lib:
+                self._counts[lib["Id"]] = lib["Count"]
+            if "TypeCounts" in lib:
+                self._type_counts[lib["Id"]] = lib["TypeCounts"]
+            # Stored items are plain dicts; parse them like a fresh response
+            latest = [EmbyItem.from_api(i) for i in lib.get("LatestItems", []) if isinstance(i, dict)]
+            lib["LatestItems"] = latest
+            self._latest[lib["Id"]] = latest
+            self._watermarks[lib["Id"]] = max(
+                (i.date_created for i in latest if i.date_created), default=""
+            )
+        super().async_restore(data, available)
+
+    def _previous_library(self, item: dict) -> dict:
+        """Return the last known data for a library, or an empty placeholder."""
+        for lib in (self.data or {}).get("libraries", []):
+            if lib["Id"] == item["Id"]:
+                return lib
+        return {
+            "Id": item["Id"],
+            "Name": item["Name"],
+            "Type": item.get("CollectionType", "unknown"),
+            "Count": 0,
+            "TypeCounts": {},
+            "LatestItems": []
+        }
+
+    async def _async_fetch_library(self, item: dict, changed: bool = True, reseed: bool = False) -> dict:
+        """Fetch count and latest items (or channels) for a single library."""
+        col_type = item.get("CollectionType", "unknown")
+
+        # --- A. LIVE TV LOGIC ---
+        if col_type == "livetv":
+            now = time.time()
+            # Reload once half of the guide window has aired
+            if self._guide.needs_reload(now, self._guide_window / 2):
+                await self._async_load_guide(now)
+
+            return {
+                "Id": item["Id"],
+                "Name": item["Name"],
+                "Type": col_type,
+                "Count": self._guide.channel_count,
+                "LatestItems": self._guide.snapshot(now, LIVE_TV_SENSOR_CHANNELS)
+            }
+
+        # --- B. STANDARD MEDIA LOGIC (Movies, TV, etc) ---
+        # Counts and latest items are independent, so request them all at once
+        count, type_counts, latest_items = await asyncio.gather(
+            self._async_library_count(item["Id"], changed),
+            self._async_library_type_counts(item["Id"], col_type, changed),
+            self._async_latest_items(item["Id"], changed, reseed),
+        )
+
+        return {
+            "Id": item["Id"],
+            "Name": item["Name"],
+            "Type": col_type,
+            "Count": count,
+            "TypeCounts": type_counts,
+            "LatestItems": latest_items
+        }
+
+
+    async def _async_load_guide(self, now: float) -> None:
+        """Download all channels and the programs airing in the guide window."""
+        window_end = now + self._guide_window
+
+        async def collect(pages) -> list[dict]:
+            # Paged, so a large guide is never one multi-megabyte body
+            return [item async for item in pages]
+
+        try:
+            channels, programs = await asyncio.gather(
+                self._limited(collect(self.client.iter_live_tv_channels(
+                    params={"AddCurrentProgram": "false"}, priority=PRIORITY_BACKGROUND
+                ))),
+                self._limited(collect(self.client.iter_live_tv_programs(
+                    params={
+                        "MinEndDate": datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "MaxStartDate": datetime.fromtimestamp(window_end, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    },
+                    priority=PRIORITY_BACKGROUND,
+                ))),
+            )
+        except CannotConnect as err:
+            # Keep the guide we have; the library falls back to its previous data
+            raise UpdateFailed(f"Live TV guide could not be loaded: {err}") from err
+        self._guide.load(channels, programs, now, window_end)
+        _LOGGER.debug(f"Loaded Live TV guide: {self._guide.stats}")
+
+    async def _async_library_count(self, library_id: str, check: bool) -> int:
+        """Return the item count of a library, re-counting only after a change."""
+        cached = self._counts.get(library_id)
+        if cached is not None and not check:
+            return cached
+
+        resp = await self._limited(self.client.get_items(
+            params={
+                "ParentId": library_id,
+                "Recursive": "true",
+                "IncludeItemTypes": LATEST_ITEM_TYPES,
+            },
+            profile="count",
+            priority=PRIORITY_BACKGROUND,
+        ))
+        if resp is None:
+            # Keep the last count rather than showing an empty library
+            self._dirty = True
+            return cached or 0
+        total = resp.get("TotalRecordCount", 0)
+        self._counts[library_id] = total
+        return total
+
+    async def _async_library_type_counts(self, library_id: str, col_type: str, check: bool) -> dict[str, int]:
+        """Return a library's per-type counts, re-counting only after a change.
+
+        One Limit=0 query per item type the library can hold (two at most for
+        the usual libraries), since Items/Counts cannot be scoped to a library.
+        """
+        cached = self._type_counts.get(library_id)
+        if cached is not None and not check:
+            return cached
+
+        names = COLLECTION_TYPE_COUNTS.get(col_type, ())
+        responses = await asyncio.gather(*(
+            self._limited(self.client.get_items(
+                params={
+                    "ParentId": library_id,
+                    "Recursive": "true",
+                    "IncludeItemTypes": LIBRARY_TYPE_COUNTS[name],
+                },
+                profile="count",
+                priority=PRIORITY_BACKGROUND,
+            ))
+            for name in names
+        ))
+        if any(resp is None for resp in responses):
+            # Keep the last breakdown rather than showing zeros
+            self._dirty = True
+            return cached or {}
+        counts = {name: resp.get("TotalRecordCount", 0) for name, resp in zip(names, responses)}
+        self._type_counts[library_id] = counts
+        return counts
+
+    async def _async_item_counts(self, check: bool) -> dict[str, int]:
+        """Return the server-wide per-type counts, re-read only after a change."""
+        if self._item_counts is not None and not check:
+            return self._item_counts
+        resp = await self._limited(self.client.get_item_counts(priority=PRIORITY_BACKGROUND))
+        if resp is None:
+            self._dirty = True
+            return self._item_counts or {}
+        self._item_counts = {name: resp.get(field, 0) for name, field in LIBRARY_COUNT_FIELDS.items()}
+        return self._item_counts
+
+    async def _async_latest_items(self, library_id: str, check: bool, reseed: bool) -> list[EmbyItem]:
+        """Return the newest items of a library, fetching only what was added since last time."""
+        window = self._latest.get(library_id)
+        watermark = self._watermarks.get(library_id)
+        if window is not None and not (check or reseed):
+            return window
+
+        incremental = window is not None and watermark and not reseed
+        params = {
+            "ParentId": library_id,
+            "Recursive": "true",
+            "SortBy": "DateCreated",
+            "SortOrder": "Descending",
+            "IncludeItemTypes": LATEST_ITEM_TYPES,
+            "Limit": LATEST_INCREMENTAL_LIMIT if incremental else LATEST_ITEMS_WINDOW,
+        }
+        if incremental:
+            # DateLastSaved also moves on metadata edits, so filter on DateCreated below
+            params["MinDateLastSaved"] = watermark
+        resp = await self._limited(self.client.get_items(
+            params=params, profile="latest", priority=PRIORITY_BACKGROUND,
+        ))
+        if resp is None:
+            # Keep the last window and watermark rather than blanking it; retry next poll
+            self._dirty = True
+            if reseed:
+                self._reseed = True
+            return window or []
+        items = [EmbyItem.from_api(i) for i in resp.get("Items", [])]
+
+        if incremental:
+            if len(items) >= LATEST_INCREMENTAL_LIMIT:
+                # Too much changed to merge safely; start over
+                return await self._async_latest_items(library_id, True, True)
+            known = {i.id for i in window}
+            added = [i for i in items if (i.date_created or "") > watermark and i.id not in known]
+            if not added:
+                return window
+            items = sorted(added + window, key=lambda i: i.date_created or "", reverse=True)
+            items = items[:LATEST_ITEMS_WINDOW]
+
+        self._latest[library_id] = items
+        self._watermarks[library_id] = max(
+            (i.date_created for i in items if i.date_created), default=watermark or ""
+        )
+        return items
+
+
+@dataclass
+class EmbyRuntimeData:
+    """Everything a config entry keeps alive while loaded."""
+
+    client: EmbyClient
+    sessions: EmbySessionCoordinator
+    server: EmbyServerCoordinator
+    libraries: EmbyLibraryCoordinator
+    store: EmbySnapshotStore | None = None
+    lifecycle: SessionEntityLifecycle | None = None
+
+    @property
+    def coordinators(self) -> tuple[EmbyDataUpdateCoordinator, ...]:
+        return (self.sessions, self.server, self.libraries)
@@ -0,0 +1,31 @@
+"""Diagnostics support for Emby Modern."""
+from __future__ import annotations
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_HOST
+from homeassistant.core import HomeAssistant
+
+TO_REDACT = {CONF_API_KEY, CONF_HOST, "LocalAddress", "LocalAddresses", "RemoteAddresses", "WanAddress"}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return what this integration costs: request, socket and refresh statistics."""
+    runtime = entry.runtime_data
+    client = runtime.client
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "server": async_redact_data(runtime.server.data.get("system_info", {}), TO_REDACT),
+        "coordinators": {
+            coordinator.name: coordinator.cycle_stats for coordinator in runtime.coordinators
+        },
+        "requests": client.request_metrics.as_dict(),
+        "cache": client.cache_stats,
+        "connection": client.health_stats,
+        "transport": client.transport_stats,
+        "events": client.event_metrics,
+    }
@@ -0,0 +1,141 @@
+"""WebSocket event dispatcher for the Emby client."""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from typing import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Messages waiting for delivery before the oldest ones are dropped
+DEFAULT_MAX_QUEUE = 256
+
+# Message types that carry a full snapshot; only the newest queued one is delivered
+COALESCED_TYPES = frozenset({"Sessions", "ScheduledTasksInfo"})
+
+
+class EmbyEventDispatcher:
+    """Deliver WebSocket messages to listeners, indexed by MessageType.
+
+    The socket reader only calls dispatch(), which never blocks: messages go into a
+    bounded queue and a worker task runs the listeners. When the queue is full the
+    oldest message is dropped, and snapshot messages (e.g. Sessions) that have a
+    newer copy queued are skipped, so event storms can't stall socket reads.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int = DEFAULT_MAX_QUEUE):
+        self._loop = loop
+        self._listeners: dict[str, list[Callable]] = {}
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._queued_by_type: dict[str, int] = {}
+        self._task: asyncio.Task | None = None
+
+        # Metrics
+        self._max_depth = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._errors = 0
+        self._latency: dict[str, dict] = {}
+
+    def subscribe(self, message_type: str, callback: Callable) -> Callable[[], None]:
+        """Register a listener; returns a function that removes it again."""
+        self._listeners.setdefault(message_type, []).append(callback)
+
+        def unsubscribe() -> None:
+            listeners = self._listeners.get(message_type, [])
+            if callback in listeners:
+                listeners.remove(callback)
+            if not listeners:
+                self._listeners.pop(message_type, None)
+
+        return unsubscribe
+
+    def dispatch(self, message: dict) -> None:
+        """Queue a message for delivery. Safe to call from the socket reader."""
+        msg_type = message.get("MessageType")
+        if msg_type not in self._listeners:
+            return
+
+        if self._queue.full():
+            dropped = self._queue.get_nowait()
+            self._unqueue(dropped.get("MessageType"))
+            self._dropped += 1
+
+        self._queue.put_nowait(message)
+        self._queued_by_type[msg_type] = self._queued_by_type.get(msg_type, 0) + 1
+        self._max_depth = max(self._max_depth, self._queue.qsize())
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _unqueue(self, msg_type: str) -> int:
+        """Decrement the queued count for a type; returns how many are still queued."""
+        remaining = self._queued_by_type.get(msg_type, 1) - 1
+        if remaining:
+            self._queued_by_type[msg_type] = remaining
+        else:
+            self._queued_by_type.pop(msg_type, None)
+        return remaining
+
+    async def _run(self) -> None:
+        while True:
+            message = await self._queue.get()
+            msg_type = message.get("MessageType")
+
+            # A newer snapshot of the same type is already queued; skip this one
+            if self._unqueue(msg_type) and msg_type in COALESCED_TYPES:
+                self._coalesced += 1
+                continue
+
+            for listener in list(self._listeners.get(msg_type, [])):
+                started = time.perf_counter()
+                try:
+                    listener(message)
+                except Exception as e:
+                    self._errors += 1
+                    _LOGGER.error(f"Error in listener for {msg_type}: {e}")
+                self._record_latency(msg_type, time.perf_counter() - started)
+            self._delivered += 1
+
+            # Let the rest of the event loop run between messages during a burst
+            if not self._queue.empty():
+                await asyncio.sleep(0)
+
+    def _record_latency(self, msg_type: str, seconds: float) -> None:
+        stats = self._latency.setdefault(msg_type, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        ms = seconds * 1000
+        stats["calls"] += 1
+        stats["total_ms"] += ms
+        stats["max_ms"] = max(stats["max_ms"], ms)
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self._max_depth,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "coalesced": self._coalesced,
+            "listener_errors": self._errors,
+            "listeners": {t: len(cbs) for t, cbs in self._listeners.items()},
+            "listener_latency": {
+                t: {
+                    "calls": s["calls"],
+                    "avg_ms": round(s["total_ms"] / s["calls"], 3),
+                    "max_ms": round(s["max_ms"], 3),
+                }
+                for t, s in self._latency.items()
+            },
+        }
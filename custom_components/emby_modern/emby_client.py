@@ -1,12 +1,108 @@
 import logging
 import asyncio
 import json
+import time
 import aiohttp
-from typing import Any, Callable
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable
 from aiohttp import ClientSession, ClientError, ClientTimeout, WSMsgType
 
+from .cache import MISS, ResponseCache
+from .dispatcher import EmbyEventDispatcher
+from .health import STATE_HALF_OPEN, Backoff, ConnectionHealth
+from .metrics import ClientMetrics
+from .transport import PRIORITY_BACKGROUND, PRIORITY_POLLING, PriorityLimiter
+
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a GET response may be served from cache, by endpoint (first match wins).
+# Anything not listed here (Sessions, Users, commands) always goes to the server.
+CACHE_TTLS = (
+    (r"^System/Info$", 60),
+    (r"^Users/[^/]+/Views$", 600),
+    (r"^Users/[^/]+/Items/[^/]+$", 300),
+    (r"^Users/[^/]+/Items$", 120),
+    (r"^LiveTv/Channels$", 60),
+    # Only changes with the library, and LibraryChanged clears it
+    (r"^Items/Counts$", 3600),
+)
+
+# Minimal payload settings for each kind of item query. Explicit caller params win.
+# Emby only adds the optional Fields listed here to its base item DTO.
+QUERY_PROFILES = {
+    # Only TotalRecordCount is read
+    "count": {
+        "Limit": 0,
+        "Fields": "",
+        "EnableImages": "false",
+        "EnableUserData": "false",
+        "EnableTotalRecordCount": "true",
+    },
+    # Library sensor "latest items" attributes
+    "latest": {
+        "Fields": "DateCreated,PremiereDate,ProductionYear",
+        "EnableImages": "false",
+        "EnableUserData": "false",
+        "EnableTotalRecordCount": "false",
+    },
+    # Media browser tiles: name, type and one thumbnail
+    "browse": {
+        "Fields": "",
+        "EnableImages": "true",
+        "EnableImageTypes": "Primary,Backdrop",
+        "ImageTypeLimit": 1,
+        "EnableUserData": "false",
+    },
+    # Media browser folder header
+    "item": {
+        "Fields": "",
+        "EnableImageTypes": "Primary",
+        "ImageTypeLimit": 1,
+        "EnableUserData": "false",
+    },
+    # Live TV channel list with the program currently airing
+    "channels": {
+        "Fields": "",
+        "EnableImages": "false",
+        "EnableUserData": "false",
+        "AddCurrentProgram": "true",
+    },
+    # Guide entries: name, channel and times only
+    "programs": {
+        "Fields": "",
+        "EnableImages": "false",
+        "EnableUserData": "false",
+        "SortBy": "StartDate",
+    },
+}
+
+# Requests in flight at once (the limiter's slots), and the idle keep-alive (seconds)
+# of the pool the client creates when it is not given a session
+HTTP_POOL_SIZE = 8
+HTTP_KEEPALIVE = 60
+# Requests per second (sustained / burst) sent to the server
+HTTP_RATE_LIMIT = 20
+HTTP_RATE_BURST = 40
+
+# GETs are retried this many times on connection errors (commands never are)
+HTTP_RETRIES = 2
+HTTP_RETRY_DELAY = 0.5
+
+# WebSocket reconnect backoff (seconds)
+WS_RECONNECT_MIN_DELAY = 1.0
+WS_RECONNECT_MAX_DELAY = 300.0
+# After ServerRestarting, hold requests back briefly rather than letting them time out
+SERVER_RESTART_GRACE = 5.0
+
+# Default page size for iter_items and the other paged listings
+ITEMS_PAGE_SIZE = 200
+
+# WebSocket events that make cached responses stale, mapped to the endpoints they affect
+CACHE_INVALIDATIONS = {
+    "LibraryChanged": r"^(Users/[^/]+/(Views|Items)|Items/Counts|LiveTv/)",
+    "UserDataChanged": r"^Users/[^/]+/Items",
+}
+
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
 
@@ -21,8 +117,16 @@ class EmbyClient:
         self.port = port
         self.api_key = api_key
         self.ssl = ssl
+        # Home Assistant passes its shared session (user agent, SSL context, closed at
+        # shutdown). Without one, e.g. in tools/, the client creates and closes its own pool.
         self._session = session
+        self._owns_session = session is None
+        # Interactive commands go first, then polling, then background work
+        self._limiter = PriorityLimiter(HTTP_POOL_SIZE, HTTP_RATE_LIMIT, HTTP_RATE_BURST)
+        # Per-endpoint latency/size/status and WebSocket traffic, for diagnostics
+        self._metrics = ClientMetrics()
         self._server_name = None
+        self._server_version = None
         self._user_id = None 
         
         protocol = "https" if ssl else "http"
@@ -31,15 +135,32 @@ class EmbyClient:
         # WebSocket Variables
         self._ws_url = f"{'wss' if ssl else 'ws'}://{host}:{port}/embywebsocket?api_key={api_key}&deviceId=homeassistant"
         self._ws = None
-        self._listeners = {} # { "EventName": [callback_function] }
+        self._connection_listeners = [] # [callback_function(connected: bool)]
+        self._ws_connected = False
         self._loop = loop or asyncio.get_event_loop()
+        # Listeners run off a queue, never inside the socket reader
+        self._dispatcher = EmbyEventDispatcher(self._loop)
+
+        # Shared health for HTTP and WebSocket: backoff with jitter plus circuit breaker
+        self._health = ConnectionHealth()
+        self._ws_backoff = Backoff(base=WS_RECONNECT_MIN_DELAY, cap=WS_RECONNECT_MAX_DELAY)
+        self._reconnect_now = asyncio.Event()
         self._ws_task = None
 
+        # GET response cache, kept fresh by WebSocket events
+        self._cache = ResponseCache(CACHE_TTLS)
+        # Identical GETs currently on the wire, keyed like the cache
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Bumped whenever cached responses go stale; fetches that straddle a bump aren't stored
+        self._cache_generation = 0
+        self._coalesced_requests = 0
+        for event_name in CACHE_INVALIDATIONS:
+            self.add_message_listener(event_name, self._handle_cache_invalidation)
+        self.add_message_listener("ServerRestarting", self._handle_cache_clear)
+        self.add_message_listener("ServerRestarting", self._handle_server_restarting)
+
     async def validate_connection(self) -> dict:
         """Validate connection and get System Info."""
-        if self._session is None:
-             raise CannotConnect("No aiohttp session provided.")
-
         try:
             info = await self.get_system_info()
             self._server_name = info.get("ServerName", "Emby Server")
@@ -48,6 +169,7 @@ class EmbyClient:
             
             # Start WebSocket connection in background if validated
             if not self._ws_task:
+                self._dispatcher.start()
                 self._ws_task = self._loop.create_task(self._websocket_loop())
 
             return {
@@ -76,15 +198,124 @@ class EmbyClient:
         except Exception:
             pass # Non-critical if user ID finding fails initially
 
-    async def api_request(self, method: str, endpoint: str, params: dict = None, json_data: dict = None) -> Any:
+    def _get_session(self) -> ClientSession:
+        if self._session is None or (self._owns_session and self._session.closed):
+            # One connection more than the limiter's slots: the long-lived WebSocket keeps one
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_SIZE + 1,
+                limit_per_host=HTTP_POOL_SIZE + 1,
+                keepalive_timeout=HTTP_KEEPALIVE,
+            )
+            self._session = ClientSession(connector=connector)
+        return self._session
+
+    async def api_request(
+        self, method: str, endpoint: str, params: dict = None, json_data: dict = None, priority: int = PRIORITY_POLLING
+    ) -> Any:
+        """Call the Emby API.
+
+        Cacheable GETs may be answered from the response cache, and identical GETs
+        that are already in flight share a single request. `priority` picks the
+        request lane (see transport.py).
+        """
+        if method != "GET":
+            result, _ = await self._request(method, endpoint, params, json_data, priority)
+            return result
+
+        key = self._cache.make_key(endpoint, params)
+        ttl = self._cache.ttl_for(endpoint)
+        if ttl is not None:
+            cached = self._cache.get(key)
+            if cached is not MISS:
+                return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            # Run the fetch as its own task so a cancelled caller can't cancel it for the others
+            task = self._loop.create_task(self._fetch_shared(key, ttl, endpoint, params, priority))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._inflight_done, key))
+        else:
+            self._coalesced_requests += 1
+        return await asyncio.shield(task)
+
+    async def _fetch_shared(self, key: tuple, ttl: float | None, endpoint: str, params: dict | None, priority: int) -> Any:
+        generation = self._cache_generation
+        result, size = await self._request("GET", endpoint, params, priority=priority)
+        # The answer may predate an invalidation that arrived meanwhile
+        if ttl is not None and result is not None and generation == self._cache_generation:
+            self._cache.set(key, result, ttl, size)
+        return result
+
+    def _inflight_done(self, key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error as seen in case every waiter has gone away
+        if not task.cancelled():
+            task.exception()
+
+    async def _request(
+        self, method: str, endpoint: str, params: dict = None, json_data: dict = None, priority: int = PRIORITY_POLLING
+    ) -> tuple[Any, int]:
+        """Send a request through the circuit breaker; returns the decoded body and its size in bytes.
+
+        GETs are retried with jittered backoff on connection errors. Commands are not,
+        since they may not be idempotent.
+        """
+        attempts = HTTP_RETRIES + 1 if method == "GET" else 1
+        retry_backoff = Backoff(base=HTTP_RETRY_DELAY, cap=HTTP_RETRY_DELAY * 4)
+
+        if not self._health.allow_request():
+            raise CannotConnect(f"Emby server unavailable, next attempt in {self._health.retry_in:.0f}s")
+        # Half-open only lets one request through: the probe
+        is_probe = self._health.state == STATE_HALF_OPEN
+        # The breaker gets one verdict per request, once its retries are used up
+        try:
+            for attempt in range(attempts):
+                try:
+                    async with self._limiter.slot(priority):
+                        result = await self._send_request(method, endpoint, params, json_data)
+                except CannotConnect:
+                    if attempt + 1 >= attempts:
+                        raise
+                    self._metrics.record_retry(endpoint)
+                    await asyncio.sleep(retry_backoff.next_delay())
+                    continue
+                self._health.record_success()
+                return result
+        except CannotConnect:
+            self._health.record_failure()
+            raise
+        except InvalidAuth:
+            # The server answered, so the connection itself is fine
+            self._health.record_success()
+            raise
+        except BaseException:
+            # Ended without a verdict; only the probe may hand its slot back
+            if is_probe:
+                self._health.release_probe()
+            raise
+
+    async def _send_request(self, method: str, endpoint: str, params: dict = None, json_data: dict = None) -> tuple[Any, int]:
+        """Send one HTTP request and record its latency, status and size."""
         headers = {"X-Emby-Token": self.api_key, "Accept": "application/json"}
         url = f"{self._url}/{endpoint}"
+        started = time.perf_counter()
+        status = None
+        size = 0
         try:
-            async with self._session.request(
+            async with self._get_session().request(
                 method, url, headers=headers, params=params, json=json_data, timeout=ClientTimeout(total=10)
             ) as resp:
+                status = resp.status
                 if resp.status == 401: raise InvalidAuth("Invalid API Key")
-                if resp.status == 204: return None
+                if resp.status == 204: return None, 0
+                # Proxy/startup errors mean the server isn't really there
+                if resp.status in (502, 503, 504):
+                    # An error, not a completed request: recorded here and skipped in finally
+                    self._metrics.record_error(endpoint, (time.perf_counter() - started) * 1000, status=status)
+                    status = None
+                    raise CannotConnect(f"Server unavailable ({resp.status})")
                 
                 if resp.status >= 400:
                     try:
@@ -92,30 +323,192 @@ class EmbyClient:
                     except:
                         error_text = ""
                     _LOGGER.error(f"Emby API Error {resp.status} on {endpoint}: {error_text}")
-                    return None
+                    return None, 0
                 
+                body = await resp.read()
+                size = len(body)
                 try:
-                    return await resp.json()
-                except Exception:
-                    return None
+                    return json.loads(body), size
+                except ValueError:
+                    return None, size
                     
         except ClientError as err:
+            self._metrics.record_error(endpoint, (time.perf_counter() - started) * 1000)
+            status = None
             raise CannotConnect(f"Connection error: {err}")
+        except asyncio.TimeoutError as err:
+            self._metrics.record_error(endpoint, (time.perf_counter() - started) * 1000, timeout=True)
+            status = None
+            raise CannotConnect(f"Timeout talking to {endpoint}") from err
+        finally:
+            if status is not None:
+                self._metrics.record_request(endpoint, (time.perf_counter() - started) * 1000, status, size)
+
+    # --- Response Cache ---
+
+    @property
+    def cache_stats(self) -> dict:
+        return {
+            **self._cache.stats,
+            "in_flight": len(self._inflight),
+            "coalesced": self._coalesced_requests,
+        }
+
+    def _handle_cache_invalidation(self, data):
+        pattern = CACHE_INVALIDATIONS.get(data.get("MessageType"))
+        if pattern:
+            self._cache.invalidate(pattern)
+            self._forget_inflight()
+
+    def _handle_cache_clear(self, data=None):
+        self._cache.clear()
+        self._forget_inflight()
+
+    def _forget_inflight(self) -> None:
+        """Keep requests started before a change out of the cache and away from new callers."""
+        self._cache_generation += 1
+        # Running fetches still answer their own callers; later ones start afresh
+        self._inflight.clear()
 
     # --- API Methods ---
 
     async def get_system_info(self) -> dict:
-        return await self.api_request("GET", "System/Info") or {}
+        info = await self.api_request("GET", "System/Info") or {}
+        if info:
+            self._server_name = info.get("ServerName", self._server_name)
+            self._server_version = info.get("Version", self._server_version)
+        return info
 
-    async def get_media_folders(self) -> dict:
+    async def get_media_folders(self, priority: int = PRIORITY_POLLING) -> dict:
         if not self._user_id: await self._find_user_id()
         if not self._user_id: return {}
-        return await self.api_request("GET", f"Users/{self._user_id}/Views")
+        return await self.api_request("GET", f"Users/{self._user_id}/Views", priority=priority)
+
+    @staticmethod
+    def _with_profile(profile: str, params: dict | None = None) -> dict:
+        """Apply a QUERY_PROFILES entry underneath the caller's params."""
+        return {**QUERY_PROFILES[profile], **(params or {})}
 
-    async def get_items(self, params: dict) -> dict:
+    async def get_items(self, params: dict, profile: str = "browse", priority: int = PRIORITY_POLLING) -> dict:
         if not self._user_id: await self._find_user_id()
         if not self._user_id: return {}
-        return await self.api_request("GET", f"Users/{self._user_id}/Items", params=params)
+        return await self.api_request(
+            "GET", f"Users/{self._user_id}/Items", params=self._with_profile(profile, params), priority=priority
+        )
+
+    async def get_item(self, item_id: str, profile: str = "item", priority: int = PRIORITY_BACKGROUND) -> dict:
+        if not self._user_id: await self._find_user_id()
+        if not self._user_id: return {}
+        return await self.api_request(
+            "GET", f"Users/{self._user_id}/Items/{item_id}", params=self._with_profile(profile), priority=priority
+        )
+
+    async def get_item_counts(self, priority: int = PRIORITY_BACKGROUND) -> dict:
+        """Per-type item counts (MovieCount, SeriesCount, ...) for the whole server.
+
+        Items/Counts only filters by user, so it cannot count a single library.
+        """
+        if not self._user_id: await self._find_user_id()
+        if not self._user_id: return {}
+        return await self.api_request("GET", "Items/Counts", params={"UserId": self._user_id}, priority=priority)
+
+    async def get_live_tv_channels(self, params: dict | None = None, priority: int = PRIORITY_POLLING) -> dict:
+        return await self.api_request(
+            "GET", "LiveTv/Channels", params=self._with_profile("channels", params), priority=priority
+        )
+
+    async def get_live_tv_programs(self, params: dict | None = None, priority: int = PRIORITY_BACKGROUND) -> dict:
+        if not self._user_id: await self._find_user_id()
+        params = self._with_profile("programs", params)
+        if self._user_id:
+            params["UserId"] = self._user_id
+        return await self.api_request("GET", "LiveTv/Programs", params=params, priority=priority)
+
+    async def iter_items(
+        self,
+        params: dict,
+        page_size: int = ITEMS_PAGE_SIZE,
+        prefetch: bool = True,
+        limit: int | None = None,
+        profile: str = "browse",
+        priority: int = PRIORITY_BACKGROUND,
+    ) -> AsyncIterator[dict]:
+        """Yield items from Users/{id}/Items one page at a time.
+
+        Only one page (two with prefetch) is held at once, so large libraries can be
+        walked with bounded memory. With prefetch the next page is requested while the
+        caller works through the current one. `limit` caps the total number of items.
+        """
+        if not self._user_id: await self._find_user_id()
+        if not self._user_id: return
+        fetch = partial(self.get_items, profile=profile, priority=priority)
+        async for item in self._iter_pages(fetch, params, page_size, prefetch, limit):
+            yield item
+
+    def iter_live_tv_channels(
+        self, params: dict | None = None, page_size: int = ITEMS_PAGE_SIZE, priority: int = PRIORITY_BACKGROUND
+    ) -> AsyncIterator[dict]:
+        """Yield every Live TV channel, a page at a time (see iter_items)."""
+        fetch = partial(self.get_live_tv_channels, priority=priority)
+        return self._iter_pages(fetch, params or {}, page_size)
+
+    def iter_live_tv_programs(
+        self, params: dict | None = None, page_size: int = ITEMS_PAGE_SIZE, priority: int = PRIORITY_BACKGROUND
+    ) -> AsyncIterator[dict]:
+        """Yield every matching guide entry, a page at a time (see iter_items)."""
+        fetch = partial(self.get_live_tv_programs, priority=priority)
+        return self._iter_pages(fetch, params or {}, page_size)
+
+    async def _iter_pages(
+        self,
+        fetch: Callable[[dict], Awaitable[dict]],
+        params: dict,
+        page_size: int,
+        prefetch: bool = True,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict]:
+        """Walk a StartIndex/Limit listing, requesting the next page ahead if asked to."""
+        start = int(params.get("StartIndex", 0))
+        remaining = limit
+
+        def request_page(start_index):
+            size = page_size if remaining is None else min(page_size, remaining)
+            return fetch({**params, "StartIndex": start_index, "Limit": size})
+
+        pending = request_page(start)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                if page is None:
+                    # An error page; stopping quietly would pass off a partial list as complete
+                    raise CannotConnect(f"Listing failed at StartIndex {start}")
+
+                items = page.get("Items") or []
+                total = page.get("TotalRecordCount")
+                start += len(items)
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+
+                more = (
+                    len(items) == page_size
+                    and (total is None or start < total)
+                    and (remaining is None or remaining > 0)
+                )
+                if more:
+                    pending = request_page(start)
+                    if prefetch:
+                        pending = self._loop.create_task(pending)
+
+                for item in items:
+                    yield item
+        finally:
+            # Caller stopped early: drop the page we were fetching ahead
+            if isinstance(pending, asyncio.Task):
+                pending.cancel()
+            elif pending is not None:
+                pending.close()
 
     def get_artwork_url(self, item_id: str, type: str = "Primary", max_width: int = 400) -> str:
         return f"{self._url}/Items/{item_id}/Images/{type}?maxHeight={max_width}&Quality=90"
@@ -123,52 +516,157 @@ class EmbyClient:
     def get_server_name(self): 
         return self._server_name or "Emby Server"
 
+    def get_server_version(self):
+        return self._server_version or "Unknown"
+
+    @property
+    def user_id(self) -> str | None:
+        return self._user_id
+
+    def restore_state(self, system_info: dict, user_id: str | None) -> None:
+        """Pick up where a previous run left off, before the server has been reached."""
+        self._server_name = system_info.get("ServerName", self._server_name)
+        self._server_version = system_info.get("Version", self._server_version)
+        self._user_id = self._user_id or user_id
+
     def get_server_url(self):
         return self._url
 
     # --- WebSocket Handling (ADDED) ---
 
-    def add_message_listener(self, event_name: str, callback: Callable):
-        """Register a callback for a specific WebSocket event."""
-        if event_name not in self._listeners:
-            self._listeners[event_name] = []
-        self._listeners[event_name].append(callback)
+    @property
+    def ws_connected(self) -> bool:
+        """Return True while the WebSocket is connected and receiving."""
+        return self._ws_connected
+
+    @property
+    def health_stats(self) -> dict:
+        return {**self._health.stats, "ws_connected": self._ws_connected, "ws_reconnect_attempts": self._ws_backoff.attempts}
+
+    def _handle_server_restarting(self, data=None):
+        """Fail fast while the server restarts and start reconnecting right away."""
+        self._health.trip(SERVER_RESTART_GRACE)
+        self._ws_backoff.reset()
+        self._reconnect_now.set()
+
+    @property
+    def request_metrics(self) -> ClientMetrics:
+        return self._metrics
+
+    @property
+    def transport_stats(self) -> dict:
+        return self._limiter.stats
+
+    @property
+    def event_metrics(self) -> dict:
+        return self._dispatcher.metrics
+
+    def add_message_listener(self, event_name: str, callback: Callable) -> Callable[[], None]:
+        """Register a callback for a specific WebSocket event; returns an unsubscribe function."""
+        return self._dispatcher.subscribe(event_name, callback)
+
+    def add_connection_listener(self, callback: Callable) -> Callable[[], None]:
+        """Register a callback that receives True/False when the WebSocket connects/drops."""
+        self._connection_listeners.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._connection_listeners:
+                self._connection_listeners.remove(callback)
+
+        return unsubscribe
+
+    async def async_stop(self) -> None:
+        """Stop the WebSocket and the event dispatcher."""
+        # The owner is shutting down; don't report the disconnect back to it
+        self._connection_listeners.clear()
+        if self._ws_task:
+            self._ws_task.cancel()
+            try:
+                await self._ws_task
+            except asyncio.CancelledError:
+                pass
+            self._ws_task = None
+        await self._dispatcher.stop()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _set_ws_connected(self, connected: bool):
+        if connected == self._ws_connected:
+            return
+        self._ws_connected = connected
+        if connected:
+            # Invalidation events may have been missed while the socket was down
+            self._handle_cache_clear()
+        for listener in self._connection_listeners:
+            try:
+                listener(connected)
+            except Exception as e:
+                _LOGGER.error(f"Error in connection listener: {e}")
 
     async def _websocket_loop(self):
         """Maintain WebSocket connection."""
         while True:
+            # The breaker is shared with HTTP: while it is open, don't hammer the server
+            if not self._health.allow_request():
+                delay = max(self._health.retry_in, WS_RECONNECT_MIN_DELAY)
+                _LOGGER.debug(f"Emby unavailable, WebSocket retry in {delay:.1f}s")
+                await self._wait_for_reconnect(delay)
+                continue
+
+            is_probe = self._health.state == STATE_HALF_OPEN
+            connected = False
             try:
-                async with self._session.ws_connect(self._ws_url, heartbeat=30) as ws:
+                async with self._get_session().ws_connect(self._ws_url, heartbeat=30) as ws:
+                    connected = True
                     self._ws = ws
                     _LOGGER.debug("Connected to Emby WebSocket")
                     
-                    # Send identification
+                    # Subscribe to session pushes (initial delay, interval in ms)
                     await ws.send_json({"MessageType": "SessionsStart", "Data": "1000,1000"})
+                    self._ws_backoff.reset()
+                    self._health.record_success()
+                    self._metrics.ws_connects += 1
+                    self._set_ws_connected(True)
                     
                     async for msg in ws:
                         if msg.type == WSMsgType.TEXT:
                             try:
                                 data = msg.json()
-                                msg_type = data.get("MessageType")
-                                
-                                # 1. Notify listeners for specific events
-                                if msg_type in self._listeners:
-                                    for listener in self._listeners[msg_type]:
-                                        try:
-                                            listener(data)
-                                        except Exception as e:
-                                            _LOGGER.error(f"Error in listener for {msg_type}: {e}")
-                                            
-                                # 2. Map generic 'Event' type messages (common in Emby)
-                                if msg_type == "Package" or msg_type == "ScheduledTasksInfo":
-                                    pass # Placeholder for future event handling
-                                    
                             except ValueError:
-                                pass
+                                continue
+                            # Hand off to the dispatcher queue; listeners never block reads
+                            if isinstance(data, dict):
+                                self._metrics.record_ws_message(data.get("MessageType"), len(msg.data))
+                                self._dispatcher.dispatch(data)
                         elif msg.type == WSMsgType.ERROR:
                             break
+            except asyncio.CancelledError:
+                if is_probe and not connected:
+                    self._health.release_probe()
+                raise
             except Exception as e:
-                _LOGGER.debug(f"WebSocket connection lost: {e}")
-                
-            # Reconnect delay
-            await asyncio.sleep(10)
+                if connected:
+                    _LOGGER.debug(f"WebSocket connection lost: {e}")
+                else:
+                    # Could not connect at all: counts against the server like an HTTP failure
+                    _LOGGER.debug(f"WebSocket connection failed: {e}")
+                    self._health.record_failure()
+            finally:
+                if self._ws is not None:
+                    self._metrics.ws_disconnects += 1
+                self._ws = None
+                self._set_ws_connected(False)
+
+            # Reconnect delay: exponential with jitter, cut short by ServerRestarting
+            delay = self._ws_backoff.next_delay()
+            _LOGGER.debug(f"Reconnecting to Emby WebSocket in {delay:.1f}s")
+            await self._wait_for_reconnect(delay)
+
+    async def _wait_for_reconnect(self, delay: float) -> None:
+        """Sleep before reconnecting, unless ServerRestarting asks for it sooner."""
+        try:
+            await asyncio.wait_for(self._reconnect_now.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self._reconnect_now.clear()
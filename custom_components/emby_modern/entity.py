@@ -1,4 +1,7 @@
 """Base entity for Emby Modern."""
+from typing import Any, Callable
+
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -6,13 +9,21 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from .const import DOMAIN
 
 class EmbyEntity(CoordinatorEntity, Entity):
-    """Base class for Emby entities."""
+    """Base class for Emby entities.
+
+    Coordinator updates only write state when the entity's fingerprint (the slice of
+    coordinator data it shows, plus availability) differs from the last write.
+    """
+
+    _last_fingerprint: Any = None
 
     def __init__(self, coordinator, device_id=None, device_name=None, client_name=None, version=None):
         """Initialize the entity."""
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.client = coordinator.client
+        # name -> (coordinator generation, value), see _cached()
+        self._memo: dict[str, tuple[int, Any]] = {}
         
         # 1. Determine Device Identity
         if device_id:
@@ -23,9 +34,9 @@ class EmbyEntity(CoordinatorEntity, Entity):
         else:
             # Fallback for Server Entities (like the Restart Button)
             self._device_id = coordinator.config_entry.unique_id or coordinator.config_entry.entry_id
-            self._device_name = self.coordinator.data.get("system_info", {}).get("ServerName", "Emby Server")
+            self._device_name = self.client.get_server_name()
             self._model = "Emby Server"
-            self._version = self.coordinator.data.get("system_info", {}).get("Version", "Unknown")
+            self._version = self.client.get_server_version()
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -48,3 +59,34 @@ class EmbyEntity(CoordinatorEntity, Entity):
             
         # Otherwise, calculate one based on the device
         return f"{self.coordinator.entry.unique_id}-{self._device_id}"
+
+    def _cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return compute(), worked out once per coordinator data generation."""
+        generation = self.coordinator.generation
+        hit = self._memo.get(name)
+        if hit is not None and hit[0] == generation:
+            return hit[1]
+        value = compute()
+        self._memo[name] = (generation, value)
+        return value
+
+    def _state_fingerprint(self) -> Any:
+        """Everything the entity's state depends on, compared with ==; None = always write."""
+        return None
+
+    def _full_fingerprint(self) -> Any:
+        fingerprint = self._state_fingerprint()
+        return None if fingerprint is None else (self.available, fingerprint)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        fingerprint = self._full_fingerprint()
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        super().async_write_ha_state()
+        # Writes from commands or events count too, so the next update compares against them
+        self._last_fingerprint = self._full_fingerprint()
@@ -0,0 +1,124 @@
+"""Local Live TV program guide for Emby Modern."""
+from __future__ import annotations
+from bisect import bisect_right
+from datetime import datetime, timezone
+
+OFF_AIR = "Off Air"
+
+
+def parse_date(value: str | None) -> float | None:
+    """Emby date string -> UTC timestamp."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class ChannelGuide:
+    """One channel's programs as parallel lists sorted by start time."""
+
+    __slots__ = ("channel_id", "name", "starts", "ends", "titles")
+
+    def __init__(self, channel_id: str, name: str):
+        self.channel_id = channel_id
+        self.name = name
+        self.starts: list[float] = []
+        self.ends: list[float] = []
+        self.titles: list[str] = []
+
+    def now_next(self, now: float) -> tuple[int | None, int | None]:
+        """Indexes of the program airing at `now` and the one after it."""
+        index = bisect_right(self.starts, now) - 1
+        current = index if index >= 0 and self.ends[index] > now else None
+        following = index + 1 if index + 1 < len(self.starts) else None
+        return current, following
+
+
+class GuideCache:
+    """Program guide for every channel over a fixed window.
+
+    "What is on now" is answered locally with a binary search; the only times the
+    answer changes are program starts and ends, kept in one sorted list so the
+    next one is a single lookup.
+    """
+
+    def __init__(self):
+        self._channels: list[ChannelGuide] = []
+        self._boundaries: list[float] = []
+        self.window_start: float | None = None
+        self.window_end: float | None = None
+        self.programs = 0
+
+    def load(self, channels: list[dict], programs: list[dict], window_start: float, window_end: float) -> None:
+        """Replace the guide with fresh channel and program lists."""
+        guides = {}
+        for channel in channels:
+            if channel.get("Id"):
+                guides[channel["Id"]] = ChannelGuide(channel["Id"], channel.get("Name", "Unknown"))
+
+        rows = []
+        for program in programs:
+            guide = guides.get(program.get("ChannelId"))
+            start = parse_date(program.get("StartDate"))
+            end = parse_date(program.get("EndDate"))
+            if guide is None or start is None or end is None or end <= start:
+                continue
+            rows.append((start, end, program.get("Name") or OFF_AIR, guide))
+        rows.sort(key=lambda row: row[0])
+
+        boundaries = set()
+        for start, end, title, guide in rows:
+            guide.starts.append(start)
+            guide.ends.append(end)
+            guide.titles.append(title)
+            boundaries.add(start)
+            boundaries.add(end)
+
+        self._channels = list(guides.values())
+        self._boundaries = sorted(boundaries)
+        self.window_start = window_start
+        self.window_end = window_end
+        self.programs = len(rows)
+
+    @property
+    def channel_count(self) -> int:
+        return len(self._channels)
+
+    def needs_reload(self, now: float, margin: float) -> bool:
+        """True once less than `margin` seconds of guide are left."""
+        return self.window_end is None or self.window_end - now < margin
+
+    def next_boundary(self, now: float) -> float | None:
+        """When the next program starts or ends, within the window."""
+        index = bisect_right(self._boundaries, now)
+        return self._boundaries[index] if index < len(self._boundaries) else None
+
+    def snapshot(self, now: float, limit: int | None = None) -> list[dict]:
+        """Now/next for every channel, or for the first `limit` channels."""
+        result = []
+        for guide in self._channels[:limit]:
+            current, following = guide.now_next(now)
+            result.append({
+                "name": guide.name,
+                "program": guide.titles[current] if current is not None else OFF_AIR,
+                "next": guide.titles[following] if following is not None else None,
+                "next_start": (
+                    datetime.fromtimestamp(guide.starts[following], timezone.utc).isoformat()
+                    if following is not None else None
+                ),
+            })
+        return result
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "programs": self.programs,
+            "window_start": datetime.fromtimestamp(self.window_start, timezone.utc).isoformat() if self.window_start is not None else None,
+            "window_end": datetime.fromtimestamp(self.window_end, timezone.utc).isoformat() if self.window_end is not None else None,
+        }
@@ -0,0 +1,102 @@
+"""Connection health tracking for the Emby client."""
+from __future__ import annotations
+import random
+import time
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class Backoff:
+    """Exponential backoff with jitter.
+
+    Each delay is drawn from the upper half of the current exponential step, so a
+    fleet of clients that lost the server at the same moment spreads its retries out.
+    """
+
+    def __init__(self, base: float = 1.0, cap: float = 300.0, factor: float = 2.0):
+        self.base = base
+        self.cap = cap
+        self.factor = factor
+        self.attempts = 0
+
+    def next_delay(self) -> float:
+        step = min(self.cap, self.base * self.factor ** self.attempts)
+        self.attempts += 1
+        return random.uniform(step / 2, step)
+
+    def reset(self) -> None:
+        self.attempts = 0
+
+
+class ConnectionHealth:
+    """Circuit breaker shared by HTTP requests and the WebSocket.
+
+    closed    -> requests flow; consecutive failures are counted
+    open      -> requests fail fast until the backoff delay has passed
+    half_open -> a single probe request is let through; its result closes or re-opens
+    """
+
+    def __init__(self, failure_threshold: int = 3, backoff: Backoff | None = None):
+        self.failure_threshold = failure_threshold
+        self.backoff = backoff or Backoff(base=5.0, cap=300.0)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._retry_at = 0.0
+        self._probe_in_flight = False
+
+        # Metrics
+        self.opened = 0
+        self.rejected = 0
+
+    def allow_request(self) -> bool:
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_OPEN and time.monotonic() >= self._retry_at:
+            self.state = STATE_HALF_OPEN
+        if self.state == STATE_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+        self.backoff.reset()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trip(self.backoff.next_delay())
+
+    def release_probe(self) -> None:
+        """The probe ended without a verdict (e.g. it was cancelled)."""
+        self._probe_in_flight = False
+
+    def trip(self, retry_in: float) -> None:
+        """Open the breaker now and allow the next probe after `retry_in` seconds."""
+        if self.state != STATE_OPEN:
+            self.opened += 1
+        self.state = STATE_OPEN
+        self._retry_at = time.monotonic() + retry_in
+        self._probe_in_flight = False
+
+    @property
+    def retry_in(self) -> float:
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "retry_in": round(self.retry_in, 1),
+            "times_opened": self.opened,
+            "rejected_requests": self.rejected,
+        }
@@ -0,0 +1,180 @@
+"""Lifecycle of the per-device session entities (media players, stop buttons, remotes).
+
+Sessions get a new Id every time an app restarts, so these entities are keyed by
+device instead: a returning device is rebound to the entities it already has. A
+device that has not been seen for longer than the configured TTL has all of them
+removed from the entity registry together; they are created again if it ever
+comes back.
+"""
+from __future__ import annotations
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, IGNORED_CLIENTS
+from .models import EmbySession
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often absent devices are checked against the TTL
+RETIRE_CHECK_INTERVAL = timedelta(hours=1)
+
+# Platforms whose entities are managed here
+SESSION_PLATFORMS = ("media_player", "button", "remote")
+# Unique Ids used before these entities were keyed by device ("kill-<session Id>", ...)
+LEGACY_PREFIXES = {"button": "kill-", "remote": "remote-"}
+
+
+class SessionEntityLifecycle:
+    """Creates, rebinds and retires the session entities of every platform."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator, ttl: timedelta):
+        self.hass = hass
+        self.entry = entry
+        self.coordinator = coordinator
+        self.ttl = ttl
+        # device Id -> last time a session for it was seen
+        self.last_seen: dict[str, datetime] = {}
+        # platform -> (factory, add_entities callback, device Id -> entity)
+        self._platforms: dict[str, tuple[Callable, Callable, dict[str, Entity]]] = {}
+
+    def unique_id(self, platform: str, device_id: str) -> str:
+        if platform == "media_player":
+            # Media players were always keyed by device (see EmbyEntity.unique_id)
+            return f"{self.entry.unique_id}-{device_id}"
+        return f"{self.entry.unique_id}-{platform}-{device_id}"
+
+    @callback
+    def async_restore(self, last_seen: dict[str, str]) -> None:
+        for device_id, seen in last_seen.items():
+            if (parsed := dt_util.parse_datetime(seen)) is not None:
+                self.last_seen[device_id] = parsed
+
+    def as_dict(self) -> dict[str, str]:
+        return {device_id: seen.isoformat() for device_id, seen in self.last_seen.items()}
+
+    @callback
+    def async_register(
+        self,
+        platform: str,
+        factory: Callable[[EmbySession, str, str], Entity],
+        async_add_entities: Callable,
+    ) -> Callable[[], None]:
+        """Start managing one platform's entities; returns the unregister callback.
+
+        factory(session, device_id, unique_id) builds the entity for a new device.
+        """
+        self._platforms[platform] = (factory, async_add_entities, {})
+        remove_listener = self.coordinator.async_add_listener(
+            lambda: self._async_update_platform(platform)
+        )
+        self._async_update_platform(platform)
+
+        @callback
+        def _unregister() -> None:
+            remove_listener()
+            self._platforms.pop(platform, None)
+
+        return _unregister
+
+    def _live_sessions(self) -> dict[str, EmbySession]:
+        """Controllable sessions by device Id (the session Id when there is none)."""
+        live = {}
+        for session in self.coordinator.data.get("sessions", []):
+            if session.client in IGNORED_CLIENTS: continue
+            if not session.supports_remote_control: continue
+            device_id = session.device_id or session.id
+            if device_id:
+                live.setdefault(device_id, session)
+        return live
+
+    @callback
+    def _async_update_platform(self, platform: str) -> None:
+        live = self._live_sessions()
+        # Restored sessions are not confirmed yet, so they do not count as seen
+        if self.coordinator.last_update_success:
+            now = dt_util.utcnow()
+            for device_id in live:
+                self.last_seen[device_id] = now
+
+        factory, async_add_entities, entities = self._platforms[platform]
+        new_entities = []
+        for device_id, session in live.items():
+            entity = entities.get(device_id)
+            if entity is None:
+                unique_id = self.unique_id(platform, device_id)
+                if platform in LEGACY_PREFIXES:
+                    self._async_migrate_legacy(platform, session.id, unique_id)
+                entities[device_id] = entity = factory(session, device_id, unique_id)
+                new_entities.append(entity)
+            elif platform != "media_player" and entity.session_id != session.id:
+                # The app restarted: same device, new session (media players look
+                # their session up by device on every update, so need no rebind)
+                entity.session_id = session.id
+                if entity.hass is not None:
+                    entity.async_write_ha_state()
+        if new_entities:
+            async_add_entities(new_entities)
+
+    @callback
+    def _async_migrate_legacy(self, platform: str, session_id: str, unique_id: str) -> None:
+        """Move a session-keyed entity to its device key, keeping its entity Id."""
+        ent_reg = er.async_get(self.hass)
+        entity_id = ent_reg.async_get_entity_id(platform, DOMAIN, f"{LEGACY_PREFIXES[platform]}{session_id}")
+        if entity_id and not ent_reg.async_get_entity_id(platform, DOMAIN, unique_id):
+            ent_reg.async_update_entity(entity_id, new_unique_id=unique_id)
+
+    def _device_of(self, platform: str, unique_id: str) -> str | None:
+        """The device (or legacy session) a registry entry belongs to, if it is a session entity."""
+        prefix = self.unique_id(platform, "")
+        if unique_id.startswith(prefix):
+            return unique_id[len(prefix):]
+        legacy = LEGACY_PREFIXES.get(platform)
+        if legacy and unique_id.startswith(legacy):
+            return unique_id[len(legacy):]
+        return None
+
+    @callback
+    def async_retire_stale(self, _now: datetime | None = None) -> bool:
+        """Remove session entities whose device has been gone for longer than the TTL.
+
+        Returns whether any device's record changed, so the caller can persist it.
+        """
+        if not self.coordinator.last_update_success:
+            # Without a current session list there is no telling who is gone
+            return False
+        now = dt_util.utcnow()
+        live = self._live_sessions()
+        ent_reg = er.async_get(self.hass)
+        retired = set()
+        changed = False
+
+        for reg_entry in er.async_entries_for_config_entry(ent_reg, self.entry.entry_id):
+            if reg_entry.domain not in SESSION_PLATFORMS:
+                continue
+            device_id = self._device_of(reg_entry.domain, reg_entry.unique_id)
+            if device_id is None or device_id in live:
+                continue
+            seen = self.last_seen.get(device_id)
+            if seen is None:
+                # Never seen since this was tracked (e.g. a legacy entry): start its clock now
+                self.last_seen[device_id] = now
+                changed = True
+                continue
+            if now - seen <= self.ttl:
+                continue
+            _LOGGER.debug(f"Removing {reg_entry.entity_id}: device {device_id} last seen {seen}")
+            ent_reg.async_remove(reg_entry.entity_id)
+            retired.add(device_id)
+
+        for device_id in retired:
+            self.last_seen.pop(device_id, None)
+            for _, _, entities in self._platforms.values():
+                entities.pop(device_id, None)
+        return changed or bool(retired)
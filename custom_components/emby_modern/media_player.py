@@ -7,43 +7,32 @@ from homeassistant.components.media_player import (
     BrowseMedia, MediaPlayerEntity, MediaPlayerEntityFeature, MediaPlayerState, MediaType
 )
 from homeassistant.const import DEVICE_DEFAULT_NAME
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.util import dt as dt_util
 from .browse_media import async_browse_media
-from .const import IGNORED_CLIENTS
+from .const import CONF_BROWSE_LETTER_INDEX, DEFAULT_BROWSE_LETTER_INDEX, TICKS_PER_SECOND
 from .entity import EmbyEntity 
+from .models import EmbySession
+from .transport import PRIORITY_INTERACTIVE
 
 _LOGGER = logging.getLogger(__name__)
 
-async def async_setup_entry(hass: HomeAssistant, entry: Any, async_add_entities: AddConfigEntryEntitiesCallback) -> None:
-    coordinator = entry.runtime_data
-    added_ids = set()
-
-    @callback
-    def _async_update_media_players():
-        sessions = coordinator.data.get("sessions", [])
-        new_entities = []
+# Reported positions further than this from the local estimate (a seek, a stall) re-anchor it
+POSITION_DRIFT_TOLERANCE = 10
 
-        for session in sessions:
-            if session.get("Client") in IGNORED_CLIENTS: continue
-            if not session.get("SupportsRemoteControl", False): continue
-
-            device_id = session.get("DeviceId") or session.get("Id")
-            
-            if device_id and device_id not in added_ids:
-                device_name = session.get("DeviceName") or DEVICE_DEFAULT_NAME
-                client_name = session.get("Client")
-                version = session.get("ApplicationVersion")
-                
-                entity = EmbyMediaPlayer(coordinator, device_id, device_name, client_name, version)
-                new_entities.append(entity)
-                added_ids.add(device_id)
-        
-        if new_entities:
-            async_add_entities(new_entities)
+async def async_setup_entry(hass: HomeAssistant, entry: Any, async_add_entities: AddConfigEntryEntitiesCallback) -> None:
+    runtime = entry.runtime_data
+    coordinator = runtime.sessions
 
-    entry.async_on_unload(coordinator.async_add_listener(_async_update_media_players))
-    _async_update_media_players()
+    # One player per device, retired with the device's button and remote (see lifecycle.py)
+    entry.async_on_unload(runtime.lifecycle.async_register(
+        "media_player",
+        lambda session, device_id, unique_id: EmbyMediaPlayer(
+            coordinator, device_id, session.device_name or DEVICE_DEFAULT_NAME, session.client, session.application_version
+        ),
+        async_add_entities,
+    ))
 
 
 class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
@@ -54,14 +43,29 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
         super().__init__(coordinator, device_id, device_name, client_name, version)
         self.session_id = None
         self._local_device_name = device_name
+        # A device's type and client never change, so its icon is worked out once
+        self._device_icon = None
+        # (position in seconds, when it was taken); HA extrapolates from it while playing
+        self._position_anchor = None
+        self._position_key = None
 
     @property
     def icon(self):
         """Dynamic icon based on device type or client name."""
-        device_type = str(self.session_data.get("DeviceType", "")).lower()
-        client = str(self.session_data.get("Client", "")).lower()
-        d_name = (self._local_device_name or "").lower()
-        
+        if self._device_icon is None:
+            data = self.session_data
+            if not data:
+                return "mdi:play-box-multiple"
+            self._device_icon = self._classify_device(
+                str(data.device_type or "").lower(),
+                str(data.client or "").lower(),
+                (self._local_device_name or "").lower(),
+            )
+        return self._device_icon
+
+    @staticmethod
+    def _classify_device(device_type: str, client: str, d_name: str) -> str:
+        """Pick an icon from the (lowercased) device type, client and device name."""
         if any(x in client for x in ["android", "ios", "iphone", "ipad", "mobile"]) or \
            any(x in device_type for x in ["mobile", "phone", "tablet", "ipad"]):
             if "tablet" in device_type or "ipad" in client or "galaxy tab" in d_name:
@@ -79,30 +83,82 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
         return "mdi:play-box-multiple"
 
     @property
-    def session_data(self) -> dict:
-        for s in self.coordinator.data.get("sessions", []):
-            if s.get("DeviceId") == self._device_id or s.get("Id") == self._device_id:
-                self.session_id = s.get("Id")
-                return s
-        return {}
+    def session_data(self) -> EmbySession | None:
+        return self._cached("session", self._find_session)
+
+    def _find_session(self) -> EmbySession | None:
+        session = self.coordinator.get_device_session(self._device_id)
+        if session:
+            self.session_id = session.id
+        return session
+
+    @property
+    def now_playing(self):
+        """The item playing on this device, if any."""
+        data = self.session_data
+        return data.now_playing if data else None
 
     @property
     def available(self) -> bool:
-        return bool(self.session_data) and self.coordinator.last_update_success
+        return self.session_data is not None and self.coordinator.last_update_success
+
+    def _state_fingerprint(self):
+        data = self.session_data
+        if data is None:
+            # A stable value, so an offline player is not rewritten on every push
+            return ("unavailable",)
+        # Raw PositionTicks moves on every push; the anchor only moves when corrected
+        return (
+            data.id,
+            data.now_playing,
+            data.is_paused,
+            data.is_muted,
+            data.volume_level,
+            data.device_type,
+            data.client,
+            self._position(),
+        )
+
+    def _position(self) -> tuple[float, Any] | None:
+        return self._cached("position", self._sync_position)
+
+    def _sync_position(self) -> tuple[float, Any] | None:
+        """Keep the local position anchor unless the reported position says otherwise.
+
+        The anchor is retaken when the item, the pause state or a PlaybackProgress
+        report changes, or when the reported position drifts too far from the estimate.
+        """
+        data = self.session_data
+        if data is None or data.now_playing is None or data.position_ticks is None:
+            self._position_anchor = self._position_key = None
+            return None
+
+        reported = data.position_ticks / TICKS_PER_SECOND
+        now = dt_util.utcnow()
+        key = (data.id, data.now_playing.id, data.is_paused, self.coordinator.position_reports.get(data.id))
+        if self._position_anchor is not None and key == self._position_key:
+            position, taken_at = self._position_anchor
+            expected = position if data.is_paused else position + (now - taken_at).total_seconds()
+            if abs(expected - reported) <= POSITION_DRIFT_TOLERANCE:
+                return self._position_anchor
+
+        self._position_key = key
+        self._position_anchor = (reported, now)
+        return self._position_anchor
 
     @property
     def state(self) -> MediaPlayerState | None:
         data = self.session_data
-        if not data: return MediaPlayerState.OFF
-        if data.get("PlayState", {}).get("IsPaused"): return MediaPlayerState.PAUSED
-        if "NowPlayingItem" in data: return MediaPlayerState.PLAYING
+        if data is None: return MediaPlayerState.OFF
+        if data.is_paused: return MediaPlayerState.PAUSED
+        if data.is_playing: return MediaPlayerState.PLAYING
         return MediaPlayerState.IDLE
 
     @property
     def media_content_type(self) -> MediaType | str | None:
         """Return the content type. This triggers the correct UI layout."""
-        item = self.session_data.get("NowPlayingItem", {})
-        m_type = item.get("Type")
+        item = self.now_playing
+        m_type = item.type if item else None
         
         if m_type == "Episode":
             return MediaType.TVSHOW
@@ -118,24 +174,21 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
     @property
     def media_title(self):
         """Return the title of current playing media."""
-        item = self.session_data.get("NowPlayingItem", {})
-        title = item.get("Name")
+        item = self.now_playing
+        if item is None:
+            return None
+        title = item.name
 
         # FIX: Handle Episodes (SxxExx Title)
-        if item.get("Type") == "Episode":
-            s = item.get("ParentIndexNumber")
-            e = item.get("IndexNumber")
+        if item.type == "Episode":
+            s = item.season
+            e = item.episode
             if s is not None and e is not None:
                 return f"S{s:02d}E{e:02d} {title}"
 
         # FIX: Handle Movies (Title (Year))
-        if item.get("Type") == "Movie":
-            year = item.get("ProductionYear")
-            if year is None:
-                premiere_date = item.get("PremiereDate", "")
-                if premiere_date and len(premiere_date) >= 4:
-                    year = premiere_date[:4]
-            
+        if item.type == "Movie":
+            year = item.year
             if year:
                 return f"{title} ({year})"
         
@@ -144,7 +197,8 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
     @property
     def media_series_title(self):
         """Return the title of the series (TV)."""
-        return self.session_data.get("NowPlayingItem", {}).get("SeriesName")
+        item = self.now_playing
+        return item.series_name if item else None
 
     @property
     def media_season(self):
@@ -159,23 +213,44 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
     @property
     def extra_state_attributes(self):
         """Expose season/episode as attributes for automations."""
-        item = self.session_data.get("NowPlayingItem", {})
+        item = self.now_playing
         attrs = {}
-        if item.get("ParentIndexNumber") is not None:
-            attrs["season_number"] = item.get("ParentIndexNumber")
-        if item.get("IndexNumber") is not None:
-            attrs["episode_number"] = item.get("IndexNumber")
+        if item is None:
+            return attrs
+        if item.season is not None:
+            attrs["season_number"] = item.season
+        if item.episode is not None:
+            attrs["episode_number"] = item.episode
         return attrs
 
     @property
-    def media_content_id(self): return self.session_data.get("NowPlayingItem", {}).get("Id")
+    def media_content_id(self):
+        item = self.now_playing
+        return item.id if item else None
     
     @property
     def media_image_url(self):
-        item = self.session_data.get("NowPlayingItem")
-        if item: return self.coordinator.client.get_artwork_url(item["Id"])
+        item = self.now_playing
+        if item: return self.coordinator.client.get_artwork_url(item.id)
         return None
 
+    @property
+    def media_duration(self) -> float | None:
+        item = self.now_playing
+        if item is None or not item.run_time_ticks:
+            return None
+        return item.run_time_ticks / TICKS_PER_SECOND
+
+    @property
+    def media_position(self) -> float | None:
+        anchor = self._position()
+        return anchor[0] if anchor else None
+
+    @property
+    def media_position_updated_at(self):
+        anchor = self._position()
+        return anchor[1] if anchor else None
+
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         return (
@@ -190,8 +265,8 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
 
     async def _send(self, cmd, params=None):
         if self.session_id: 
-            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing/{cmd}", params=params)
-        await self.coordinator.async_request_refresh()
+            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing/{cmd}", params=params, priority=PRIORITY_INTERACTIVE)
+        await self.coordinator.async_request_session_refresh(self.session_id)
 
     async def async_media_play(self):
         self._attr_state = MediaPlayerState.PLAYING
@@ -208,6 +283,9 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
         self.async_write_ha_state()
         await self._send("Stop")
 
+    async def async_media_seek(self, position: float) -> None:
+        await self._send("Seek", {"SeekPositionTicks": int(position * TICKS_PER_SECOND)})
+
     async def async_media_next_track(self): await self._send("NextTrack")
     async def async_media_previous_track(self): await self._send("PreviousTrack")
     
@@ -215,26 +293,33 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
         if self.session_id:
             self._attr_state = MediaPlayerState.PLAYING
             self.async_write_ha_state()
-            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing", params={"ItemIds": media_id, "PlayCommand": "PlayNow"})
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing", params={"ItemIds": media_id, "PlayCommand": "PlayNow"}, priority=PRIORITY_INTERACTIVE)
+            await self.coordinator.async_request_session_refresh(self.session_id)
 
     async def async_browse_media(self, media_content_type=None, media_content_id=None) -> BrowseMedia:
-        return await async_browse_media(self.hass, self.coordinator.client, media_content_type, media_content_id)
+        return await async_browse_media(
+            self.hass,
+            self.coordinator.client,
+            media_content_type,
+            media_content_id,
+            letter_index=self.coordinator.entry.options.get(CONF_BROWSE_LETTER_INDEX, DEFAULT_BROWSE_LETTER_INDEX),
+        )
 
     # ADDED: Volume Properties
     @property
     def volume_level(self) -> float | None:
         """Volume level of the media player (0..1)."""
-        play_state = self.session_data.get("PlayState", {})
+        data = self.session_data
         # Emby uses 0-100, HA needs 0.0-1.0
-        if "VolumeLevel" in play_state:
-            return play_state["VolumeLevel"] / 100
+        if data is not None and data.volume_level is not None:
+            return data.volume_level / 100
         return None
 
     @property
     def is_volume_muted(self) -> bool | None:
         """Boolean if volume is currently muted."""
-        return self.session_data.get("PlayState", {}).get("IsMuted", False)
+        data = self.session_data
+        return data.is_muted if data else False
 
     # ADDED: Volume Methods
     async def async_set_volume_level(self, volume: float) -> None:
@@ -245,12 +330,14 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
             await self.coordinator.client.api_request(
                 "POST", 
                 f"Sessions/{self.session_id}/Command/SetVolume",
-                params={"Volume": emby_vol}
+                params={"Volume": emby_vol},
+                priority=PRIORITY_INTERACTIVE,
             )
             # Optimistic state update
-            self.session_data.get("PlayState", {})["VolumeLevel"] = emby_vol
+            if self.session_data is not None:
+                self.session_data.volume_level = emby_vol
             self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_session_refresh(self.session_id)
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
@@ -268,5 +355,5 @@ class EmbyMediaPlayer(EmbyEntity, MediaPlayerEntity):
     async def _send_command_to_session(self, cmd):
         """Helper to send general commands to the session."""
         if self.session_id:
-            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Command/{cmd}")
-        await self.coordinator.async_request_refresh()
+            await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Command/{cmd}", priority=PRIORITY_INTERACTIVE)
+        await self.coordinator.async_request_session_refresh(self.session_id)
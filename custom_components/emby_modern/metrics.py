@@ -0,0 +1,126 @@
+"""Request and WebSocket instrumentation for the Emby client."""
+from __future__ import annotations
+import re
+
+# Upper bounds (ms) of the latency histogram buckets; anything slower lands in "inf"
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Path segments that are ids (32-hex user/session ids, GUIDs, numeric item ids)
+_ID_SEGMENT = re.compile(r"^([0-9a-fA-F]{32}|[0-9a-fA-F-]{36}|\d+)$")
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Collapse ids so e.g. Users/<id>/Items/<id> is counted as one endpoint."""
+    return "/".join("{id}" if _ID_SEGMENT.match(part) else part for part in endpoint.split("/"))
+
+
+class EndpointStats:
+    """Counters and a latency histogram for one endpoint."""
+
+    __slots__ = (
+        "requests", "errors", "timeouts", "retries", "status_codes",
+        "bytes_total", "bytes_max", "latency_total_ms", "latency_max_ms", "histogram",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.status_codes: dict[int, int] = {}
+        self.bytes_total = 0
+        self.bytes_max = 0
+        self.latency_total_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, latency_ms: float, status: int | None, size: int) -> None:
+        self.requests += 1
+        if status is not None:
+            self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        self.bytes_total += size
+        self.bytes_max = max(self.bytes_max, size)
+        self.latency_total_ms += latency_ms
+        self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def as_dict(self) -> dict:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "status_codes": dict(self.status_codes),
+            "bytes_total": self.bytes_total,
+            "bytes_max": self.bytes_max,
+            "latency_avg_ms": round(self.latency_total_ms / self.requests, 1) if self.requests else None,
+            "latency_max_ms": round(self.latency_max_ms, 1),
+            "latency_histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class ClientMetrics:
+    """Per-endpoint HTTP statistics plus WebSocket traffic counters."""
+
+    def __init__(self):
+        self._endpoints: dict[str, EndpointStats] = {}
+        self.ws_connects = 0
+        self.ws_disconnects = 0
+        self.ws_messages: dict[str, int] = {}
+        self.ws_bytes = 0
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        key = normalize_endpoint(endpoint)
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = EndpointStats()
+        return stats
+
+    def record_request(self, endpoint: str, latency_ms: float, status: int | None, size: int) -> None:
+        self._stats(endpoint).observe(latency_ms, status, size)
+
+    def record_error(self, endpoint: str, latency_ms: float, timeout: bool = False, status: int | None = None) -> None:
+        stats = self._stats(endpoint)
+        stats.observe(latency_ms, status, 0)
+        stats.errors += 1
+        if timeout:
+            stats.timeouts += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        self._stats(endpoint).retries += 1
+
+    def record_ws_message(self, msg_type: str | None, size: int) -> None:
+        key = msg_type or "unknown"
+        self.ws_messages[key] = self.ws_messages.get(key, 0) + 1
+        self.ws_bytes += size
+
+    @property
+    def totals(self) -> dict:
+        """Aggregate figures across all endpoints (used by the diagnostic sensors)."""
+        requests = sum(s.requests for s in self._endpoints.values())
+        latency = sum(s.latency_total_ms for s in self._endpoints.values())
+        return {
+            "requests": requests,
+            "errors": sum(s.errors for s in self._endpoints.values()),
+            "timeouts": sum(s.timeouts for s in self._endpoints.values()),
+            "bytes": sum(s.bytes_total for s in self._endpoints.values()),
+            "latency_avg_ms": round(latency / requests, 1) if requests else None,
+        }
+
+    def as_dict(self) -> dict:
+        return {
+            "totals": self.totals,
+            "endpoints": {name: stats.as_dict() for name, stats in sorted(self._endpoints.items())},
+            "websocket": {
+                "connects": self.ws_connects,
+                "disconnects": self.ws_disconnects,
+                "bytes": self.ws_bytes,
+                "messages": dict(self.ws_messages),
+            },
+        }
@@ -0,0 +1,170 @@
+"""Compact records for the Emby data the platforms use.
+
+API responses are parsed into these as soon as they arrive and the raw JSON is
+dropped, so coordinators only hold the fields entities actually read.
+"""
+from __future__ import annotations
+from typing import Any
+
+
+class _Record:
+    """Equality by field values, so records work in entity fingerprints."""
+
+    __slots__ = ()
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r}, name={getattr(self, 'name', None)!r})"
+
+
+class EmbyItem(_Record):
+    """A media item: what is playing, or a recently added library entry."""
+
+    __slots__ = (
+        "id", "name", "type", "series_name", "season", "episode",
+        "production_year", "premiere_date", "date_created", "run_time_ticks",
+    )
+
+    def __init__(self, id, name, type=None, series_name=None, season=None, episode=None,
+                 production_year=None, premiere_date=None, date_created=None, run_time_ticks=None):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.series_name = series_name
+        self.season = season
+        self.episode = episode
+        self.production_year = production_year
+        self.premiere_date = premiere_date
+        self.date_created = date_created
+        self.run_time_ticks = run_time_ticks
+
+    @classmethod
+    def from_api(cls, data: dict) -> EmbyItem:
+        return cls(
+            id=data.get("Id"),
+            name=data.get("Name"),
+            type=data.get("Type"),
+            series_name=data.get("SeriesName"),
+            season=data.get("ParentIndexNumber"),
+            episode=data.get("IndexNumber"),
+            production_year=data.get("ProductionYear"),
+            premiere_date=data.get("PremiereDate"),
+            date_created=data.get("DateCreated"),
+            run_time_ticks=data.get("RunTimeTicks"),
+        )
+
+    def as_dict(self) -> dict:
+        """Emby-shaped dict (for storage); parses back with from_api."""
+        data = {
+            "Id": self.id,
+            "Name": self.name,
+            "Type": self.type,
+            "SeriesName": self.series_name,
+            "ParentIndexNumber": self.season,
+            "IndexNumber": self.episode,
+            "ProductionYear": self.production_year,
+            "PremiereDate": self.premiere_date,
+            "DateCreated": self.date_created,
+            "RunTimeTicks": self.run_time_ticks,
+        }
+        return {key: value for key, value in data.items() if value is not None}
+
+    @property
+    def year(self) -> int | str | None:
+        """Production year, or the year of the premiere date."""
+        if self.production_year is not None:
+            return self.production_year
+        if self.premiere_date and len(self.premiere_date) >= 4:
+            return self.premiere_date[:4]
+        return None
+
+
+class EmbySession(_Record):
+    """A client session and its play state."""
+
+    __slots__ = (
+        "id", "device_id", "device_name", "device_type", "client", "application_version",
+        "supports_remote_control", "user_id", "user_name",
+        "now_playing", "is_paused", "is_muted", "volume_level", "position_ticks",
+    )
+
+    def __init__(self, id, device_id=None, device_name=None, device_type=None, client=None,
+                 application_version=None, supports_remote_control=False, user_id=None, user_name=None,
+                 now_playing=None, is_paused=False, is_muted=False, volume_level=None, position_ticks=None):
+        self.id = id
+        self.device_id = device_id
+        self.device_name = device_name
+        self.device_type = device_type
+        self.client = client
+        self.application_version = application_version
+        self.supports_remote_control = supports_remote_control
+        self.user_id = user_id
+        self.user_name = user_name
+        self.now_playing: EmbyItem | None = now_playing
+        self.is_paused = is_paused
+        self.is_muted = is_muted
+        self.volume_level = volume_level
+        self.position_ticks = position_ticks
+
+    @property
+    def name(self) -> str | None:
+        return self.device_name
+
+    @classmethod
+    def from_api(cls, data: dict) -> EmbySession:
+        play_state = data.get("PlayState") or {}
+        now_playing = data.get("NowPlayingItem")
+        return cls(
+            id=data.get("Id"),
+            device_id=data.get("DeviceId"),
+            device_name=data.get("DeviceName"),
+            device_type=data.get("DeviceType"),
+            client=data.get("Client"),
+            application_version=data.get("ApplicationVersion"),
+            supports_remote_control=data.get("SupportsRemoteControl", False),
+            user_id=data.get("UserId"),
+            user_name=data.get("UserName"),
+            now_playing=EmbyItem.from_api(now_playing) if now_playing else None,
+            is_paused=play_state.get("IsPaused", False),
+            is_muted=play_state.get("IsMuted", False),
+            volume_level=play_state.get("VolumeLevel"),
+            position_ticks=play_state.get("PositionTicks"),
+        )
+
+    def as_dict(self, play_state: bool = True) -> dict:
+        """Emby-shaped dict (for storage); parses back with from_api."""
+        data = {
+            "Id": self.id,
+            "DeviceId": self.device_id,
+            "DeviceName": self.device_name,
+            "DeviceType": self.device_type,
+            "Client": self.client,
+            "ApplicationVersion": self.application_version,
+            "SupportsRemoteControl": self.supports_remote_control,
+            "UserId": self.user_id,
+            "UserName": self.user_name,
+        }
+        data = {key: value for key, value in data.items() if value is not None}
+        if play_state:
+            if self.now_playing is not None:
+                data["NowPlayingItem"] = self.now_playing.as_dict()
+            data["PlayState"] = {
+                key: value for key, value in (
+                    ("IsPaused", self.is_paused),
+                    ("IsMuted", self.is_muted),
+                    ("VolumeLevel", self.volume_level),
+                    ("PositionTicks", self.position_ticks),
+                ) if value is not None
+            }
+        return data
+
+    @property
+    def is_playing(self) -> bool:
+        return self.now_playing is not None
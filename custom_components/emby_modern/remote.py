@@ -10,56 +10,41 @@ from homeassistant.components.remote import (
     DEFAULT_NUM_REPEATS,
     RemoteEntity,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from .const import IGNORED_CLIENTS
 from .entity import EmbyEntity
+from .transport import PRIORITY_INTERACTIVE
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddConfigEntryEntitiesCallback) -> None:
-    coordinator = entry.runtime_data
-    added_ids = set()
+    runtime = entry.runtime_data
+    coordinator = runtime.sessions
 
-    @callback
-    def _update_remotes():
-        sessions = coordinator.data.get("sessions", [])
-        new_entities = []
-
-        for session in sessions:
-            if session.get("Client") in IGNORED_CLIENTS: continue
-            if not session.get("SupportsRemoteControl", False): continue
-
-            # Remotes use Session Id (not Device Id) because they are ephemeral
-            session_id = session.get("Id")
-            
-            if session_id and session_id not in added_ids:
-                device_id = session.get("DeviceId") or session_id
-                device_name = session.get("DeviceName") or "Unknown Device"
-                client_name = session.get("Client")
-                
-                new_entities.append(EmbyRemote(coordinator, session_id, device_id, device_name, client_name))
-                added_ids.add(session_id)
-        
-        if new_entities:
-            async_add_entities(new_entities)
-
-    entry.async_on_unload(coordinator.async_add_listener(_update_remotes))
-    _update_remotes()
+    # One remote per device; its session is rebound when the app restarts
+    entry.async_on_unload(runtime.lifecycle.async_register(
+        "remote",
+        lambda session, device_id, unique_id: EmbyRemote(
+            coordinator, session.id, device_id, session.device_name or "Unknown Device", session.client, unique_id
+        ),
+        async_add_entities,
+    ))
 
 class EmbyRemote(EmbyEntity, RemoteEntity):
     """Emby Remote Control."""
 
-    def __init__(self, coordinator, session_id, device_id, device_name, client_name):
+    def __init__(self, coordinator, session_id, device_id, device_name, client_name, unique_id):
         super().__init__(coordinator, device_id, device_name, client_name)
         self.session_id = session_id
         # Remote entity needs a unique ID different from the media player
-        self._attr_unique_id = f"remote-{session_id}"
+        self._attr_unique_id = unique_id
         self._attr_name = None # Use device name
 
     @property
     def is_on(self) -> bool:
         """Return true if the session is still active."""
-        current_ids = [s["Id"] for s in self.coordinator.data.get("sessions", [])]
-        return self.session_id in current_ids
+        return self.coordinator.get_session(self.session_id) is not None
+
+    def _state_fingerprint(self):
+        return self.is_on
 
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """Send a command to the device."""
@@ -83,7 +68,7 @@ class EmbyRemote(EmbyEntity, RemoteEntity):
                 # Logic Fix: Differentiate between Playstate vs General Commands
                 # 1. Playstate Commands (Stop, Pause, etc.) go to /Playing/{Command}
                 if emby_cmd in ["Stop", "Pause", "Unpause", "NextTrack", "PreviousTrack"]:
-                     await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing/{emby_cmd}")
+                     await self.coordinator.client.api_request("POST", f"Sessions/{self.session_id}/Playing/{emby_cmd}", priority=PRIORITY_INTERACTIVE)
                 
                 # 2. General Commands (Up, Down, etc.) go to /Command with JSON body
                 else:
@@ -91,7 +76,8 @@ class EmbyRemote(EmbyEntity, RemoteEntity):
                          "POST", 
                          f"Sessions/{self.session_id}/Command", 
                          params={"Header": "Test", "Text": "Test"}, # Dummy params sometimes required by older clients
-                         json_data={"Name": emby_cmd} # Command goes in body
+                         json_data={"Name": emby_cmd}, # Command goes in body
+                         priority=PRIORITY_INTERACTIVE,
                      )
 
                 if delay > 0:
@@ -1,9 +1,22 @@
 """Support for Emby sensors."""
 from __future__ import annotations
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .entity import EmbyEntity
+from .models import EmbyItem
+
+# Item types that are not containers of the others, so their counts add up without overlap
+MEDIA_COUNT_LEAF_TYPES = ("movie_count", "episode_count", "song_count")
 
 # Define the possible states
 EMBY_STATE_RUNNING = "Running"
@@ -11,33 +24,111 @@ EMBY_STATE_RESTARTING = "Restarting"
 EMBY_STATE_SHUTTING_DOWN = "Shutting Down"
 EMBY_STATE_UNAVAILABLE = "Unavailable"
 
+@dataclass(frozen=True, kw_only=True)
+class EmbyDiagnosticSensorDescription(SensorEntityDescription):
+    """Describes a sensor that reports what the integration costs."""
+
+    value_fn: Callable[[Any], Any]
+
+# Disabled by default; enable them to watch request volume and latency over time
+DIAGNOSTIC_SENSORS: tuple[EmbyDiagnosticSensorDescription, ...] = (
+    EmbyDiagnosticSensorDescription(
+        key="api_requests",
+        name="API Requests",
+        icon="mdi:swap-horizontal",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda runtime: runtime.client.request_metrics.totals["requests"],
+    ),
+    EmbyDiagnosticSensorDescription(
+        key="api_errors",
+        name="API Errors",
+        icon="mdi:alert-circle-outline",
+        native_unit_of_measurement="errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda runtime: runtime.client.request_metrics.totals["errors"],
+    ),
+    EmbyDiagnosticSensorDescription(
+        key="api_latency",
+        name="API Latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda runtime: runtime.client.request_metrics.totals["latency_avg_ms"],
+    ),
+    EmbyDiagnosticSensorDescription(
+        key="api_bytes",
+        name="API Data Received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda runtime: runtime.client.request_metrics.totals["bytes"],
+    ),
+    EmbyDiagnosticSensorDescription(
+        key="library_refresh_time",
+        name="Library Refresh Time",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda runtime: runtime.libraries.cycle_stats["last_ms"],
+    ),
+)
+
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddConfigEntryEntitiesCallback) -> None:
-    coordinator = entry.runtime_data
+    runtime = entry.runtime_data
     entities = []
     
     # 1. Add the Active Streams Sensor
-    entities.append(EmbyActiveStreamsSensor(coordinator))
+    entities.append(EmbyActiveStreamsSensor(runtime.sessions))
     
-    # 2. Add the Server Status Sensor
-    entities.append(EmbyServerStatusSensor(coordinator))
+    # 2. Add the Server Status Sensor (session polling doubles as the heartbeat)
+    entities.append(EmbyServerStatusSensor(runtime.sessions))
     
-    # 3. Add a Sensor for every Library found
-    libraries = coordinator.data.get("libraries", [])
+    # 3. Add a Sensor for every Library found, plus the server-wide per-type counts
+    libraries = runtime.libraries.data.get("libraries", [])
     for lib in libraries:
-        entities.append(EmbyLibrarySensor(coordinator, lib))
+        entities.append(EmbyLibrarySensor(runtime.libraries, lib))
+    entities.append(EmbyMediaCountsSensor(runtime.libraries))
+
+    # 4. Diagnostic sensors (refreshed with the session tier)
+    for description in DIAGNOSTIC_SENSORS:
+        entities.append(EmbyDiagnosticSensor(runtime, description))
 
     async_add_entities(entities)
 
+class EmbyDiagnosticSensor(EmbyEntity, SensorEntity):
+    """Sensor exposing request/refresh statistics of the integration itself."""
+
+    entity_description: EmbyDiagnosticSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, runtime, description: EmbyDiagnosticSensorDescription):
+        super().__init__(
+            runtime.sessions,
+            device_id=None,
+            client_name="Emby Server"
+        )
+        self._runtime = runtime
+        self.entity_description = description
+        self._attr_unique_id = f"{runtime.sessions.entry.unique_id}-diagnostic-{description.key}"
+
+    @property
+    def native_value(self):
+        return self.entity_description.value_fn(self._runtime)
+
+    def _state_fingerprint(self):
+        # Wrapped: the value is None until the first sample, which would mean "always write"
+        return (self.native_value,)
+
 class EmbyServerStatusSensor(EmbyEntity, SensorEntity):
     """Sensor to track the Emby server's operational status."""
     
     def __init__(self, coordinator):
-        ver = coordinator.data.get("system_info", {}).get("Version", "Unknown")
         super().__init__(
             coordinator, 
             device_id=None,
-            client_name="Emby Server", 
-            version=ver
+            client_name="Emby Server"
         )
         self._attr_name = "Server Status"
         self._attr_unique_id = f"{coordinator.entry.unique_id}-server-status"
@@ -61,18 +152,15 @@ class EmbyServerStatusSensor(EmbyEntity, SensorEntity):
 
     async def async_added_to_hass(self):
         """Subscribe to specific WebSocket events to update state instantly."""
+        # CoordinatorEntity already wires _handle_coordinator_update, which resets the
+        # state when the coordinator successfully reconnects after a failure
         await super().async_added_to_hass()
         
-        # Subscribe to Emby WebSocket events handled by the client object
-        # Note: Ensure your EmbyClient supports 'add_message_listener'
-        try:
-            self.coordinator.client.add_message_listener("ServerRestarting", self._handle_restart_shutdown)
-            self.coordinator.client.add_message_listener("ServerShuttingDown", self._handle_restart_shutdown)
-        except AttributeError:
-             pass # Gracefully fail if client doesn't support websockets yet
-        
-        # Reset state when coordinator successfully reconnects after a failure
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
+        # Subscribe to Emby WebSocket events; unsubscribed again when the entity is removed
+        for event_name in ("ServerRestarting", "ServerShuttingDown"):
+            self.async_on_remove(
+                self.coordinator.client.add_message_listener(event_name, self._handle_restart_shutdown)
+            )
 
     @callback
     def _handle_restart_shutdown(self, data):
@@ -94,18 +182,19 @@ class EmbyServerStatusSensor(EmbyEntity, SensorEntity):
         else:
             self._current_state = EMBY_STATE_UNAVAILABLE
             
-        self.async_write_ha_state()
+        super()._handle_coordinator_update()
+
+    def _state_fingerprint(self):
+        return (self._current_state, self.coordinator.last_update_success)
 
 class EmbyActiveStreamsSensor(EmbyEntity, SensorEntity):
     """Sensor to track active streams."""
     
     def __init__(self, coordinator):
-        ver = coordinator.data.get("system_info", {}).get("Version", "Unknown")
         super().__init__(
             coordinator, 
             device_id=None, 
-            client_name="Emby Server", 
-            version=ver
+            client_name="Emby Server"
         )
         self._attr_name = "Active Streams"
         self._attr_unique_id = f"{coordinator.entry.unique_id}-active-streams"
@@ -115,41 +204,86 @@ class EmbyActiveStreamsSensor(EmbyEntity, SensorEntity):
 
     @property
     def native_value(self) -> int:
-        return sum(1 for sess in self.coordinator.data.get("sessions", []) if "NowPlayingItem" in sess)
+        return self._cached("native_value", lambda: sum(
+            1 for sess in self.coordinator.data.get("sessions", []) if sess.is_playing
+        ))
+
+    def _state_fingerprint(self):
+        return [
+            (sess.user_name, sess.device_name, sess.now_playing)
+            for sess in self.coordinator.data.get("sessions", [])
+            if sess.is_playing
+        ]
 
     @property
     def extra_state_attributes(self):
+        return self._cached("attributes", self._build_attributes)
+
+    def _build_attributes(self) -> dict:
         streams = []
         for sess in self.coordinator.data.get("sessions", []):
-            if "NowPlayingItem" not in sess: continue
-            item = sess["NowPlayingItem"]
-            title = item.get("Name")
+            item = sess.now_playing
+            if item is None: continue
+            title = item.name
             
-            if item.get("Type") == "Episode":
-                s = item.get("ParentIndexNumber")
-                e = item.get("IndexNumber")
+            if item.type == "Episode":
+                s = item.season
+                e = item.episode
                 if s is not None and e is not None:
-                    title = f"{item.get('SeriesName')} - S{s:02d}E{e:02d} - {title}"
-            elif item.get("ProductionYear"):
-                title = f"{title} ({item.get('ProductionYear')})"
+                    title = f"{item.series_name} - S{s:02d}E{e:02d} - {title}"
+            elif item.production_year:
+                title = f"{title} ({item.production_year})"
             
             streams.append({
-                "user": sess.get("UserName", "Unknown"),
-                "device": sess.get("DeviceName", "Unknown"),
+                "user": sess.user_name or "Unknown",
+                "device": sess.device_name or "Unknown",
                 "title": title,
             })
         return {"active_streams": streams}
 
+class EmbyMediaCountsSensor(EmbyEntity, SensorEntity):
+    """Server-wide item counts by type, from a single Items/Counts call."""
+
+    def __init__(self, coordinator):
+        super().__init__(
+            coordinator,
+            device_id=None,
+            client_name="Emby Server"
+        )
+        self._attr_name = "Media Items"
+        self._attr_unique_id = f"{coordinator.entry.unique_id}-media-counts"
+        self._attr_native_unit_of_measurement = "items"
+        self._attr_state_class = SensorStateClass.TOTAL
+        self._attr_icon = "mdi:counter"
+
+    def _counts(self) -> dict:
+        return self.coordinator.data.get("item_counts") or {}
+
+    @property
+    def native_value(self) -> int:
+        # Series are left out: their episodes are already counted
+        counts = self._counts()
+        return sum(counts.get(name, 0) for name in MEDIA_COUNT_LEAF_TYPES)
+
+    def _state_fingerprint(self):
+        return self._counts()
+
+    @property
+    def extra_state_attributes(self):
+        # movie_count, series_count, episode_count, song_count
+        return self._counts()
+
 class EmbyLibrarySensor(EmbyEntity, SensorEntity):
     """Sensor to track library items."""
 
+    # Live TV's up-next listing changes at every program boundary; keep it out of history
+    _unrecorded_attributes = frozenset({"up_next"})
+
     def __init__(self, coordinator, lib_data):
-        ver = coordinator.data.get("system_info", {}).get("Version", "Unknown")
         super().__init__(
             coordinator, 
             device_id=None, 
-            client_name="Emby Server", 
-            version=ver
+            client_name="Emby Server"
         )
         self._lib_id = lib_data["Id"]
         self._lib_name = lib_data["Name"]
@@ -170,50 +304,67 @@ class EmbyLibrarySensor(EmbyEntity, SensorEntity):
         if "book" in t: return "mdi:book"
         return "mdi:folder-multiple"
 
+    def _library(self) -> dict | None:
+        return self._cached("library", lambda: next(
+            (lib for lib in self.coordinator.data.get("libraries", []) if lib["Id"] == self._lib_id), None
+        ))
+
     @property
     def native_value(self) -> int | str:
-        libraries = self.coordinator.data.get("libraries", [])
-        for lib in libraries:
-            if lib["Id"] == self._lib_id:
-                return lib["Count"]
-        return 0
+        lib = self._library()
+        return lib["Count"] if lib else 0
+
+    def _state_fingerprint(self):
+        lib = self._library()
+        if lib is None:
+            return ()
+        # Unchanged libraries keep the very same LatestItems list, so this is cheap
+        return (lib["Count"], lib.get("TypeCounts"), lib.get("LatestItems"))
 
     @property
     def extra_state_attributes(self):
-        libraries = self.coordinator.data.get("libraries", [])
+        return self._cached("attributes", self._build_attributes)
+
+    def _build_attributes(self) -> dict:
         attrs = {}
         items = []
 
-        for lib in libraries:
-            if lib["Id"] == self._lib_id:
-                items = lib.get("LatestItems", [])
-                break
+        lib = self._library()
+        if lib:
+            # movie_count, series_count, episode_count, song_count, as far as the library holds them
+            attrs.update(lib.get("TypeCounts") or {})
+            items = lib.get("LatestItems", [])
         
         if not items:
             if self.native_value == 0:
-                 return {"status": "Library is empty."}
+                 return {**attrs, "status": "Library is empty."}
             else:
-                 return {"status": "No recently added items."}
+                 return {**attrs, "status": "No recently added items."}
 
         if self._lib_type == "livetv":
+            up_next = {}
             for ch in items:
                 if isinstance(ch, dict):
                     attrs[ch.get("name", "Unknown")] = ch.get("program", "Unknown")
+                    if ch.get("next"):
+                        up_next[ch.get("name", "Unknown")] = ch["next"]
+            if up_next:
+                attrs["up_next"] = up_next
             return attrs
 
         for item in items:
             key_text = "Unknown"
             value_text = ""
 
-            if isinstance(item, dict):
-                name = item.get("Name", "Unknown")
-                year = item.get("ProductionYear")
+            if isinstance(item, EmbyItem):
+                name = item.name or "Unknown"
+                year = item.production_year
                 year_str = str(year) if year else ""
 
-                if item.get("Type") == "Episode":
-                    series = item.get("SeriesName", "Unknown Series")
-                    s = item.get("ParentIndexNumber")
-                    e = item.get("IndexNumber")
+                if item.type == "Episode":
+                    series = item.series_name or "Unknown Series"
+                    s = item.season
+                    e = item.episode
                     if s is not None and e is not None:
                         key_text = f"S{s:02d}E{e:02d} {name}"
                     else:
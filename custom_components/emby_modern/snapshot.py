@@ -0,0 +1,65 @@
+"""Last known server state, persisted so Home Assistant can start without waiting for Emby."""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .models import EmbyItem
+
+if TYPE_CHECKING:
+    from .coordinator import EmbyRuntimeData
+
+STORAGE_VERSION = 1
+# Coalesce bursts of changes into one write
+SNAPSHOT_SAVE_DELAY = 60
+
+
+class EmbySnapshotStore:
+    """Stores system info, libraries and known devices for one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._known_devices: frozenset | None = None
+
+    async def async_load(self) -> dict | None:
+        return await self._store.async_load()
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    @callback
+    def async_schedule_save(self, runtime: EmbyRuntimeData) -> None:
+        self._store.async_delay_save(lambda: self._snapshot(runtime), SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def async_sessions_updated(self, runtime: EmbyRuntimeData) -> None:
+        """Save only when the set of devices changes, not on every pushed position."""
+        devices = frozenset((runtime.sessions.data or {}).get("sessions_by_device", {}))
+        if devices != self._known_devices:
+            self._known_devices = devices
+            self.async_schedule_save(runtime)
+
+    @staticmethod
+    def _snapshot(runtime: EmbyRuntimeData) -> dict:
+        sessions = (runtime.sessions.data or {}).get("sessions", [])
+        libraries = [
+            {
+                **lib,
+                # Live TV now/next would be stale by the time it is read back
+                "LatestItems": [] if lib.get("Type") == "livetv" else [
+                    i.as_dict() if isinstance(i, EmbyItem) else i for i in lib.get("LatestItems", [])
+                ],
+            }
+            for lib in (runtime.libraries.data or {}).get("libraries", [])
+        ]
+        return {
+            "user_id": runtime.client.user_id,
+            "system_info": (runtime.server.data or {}).get("system_info", {}),
+            "libraries": libraries,
+            "item_counts": (runtime.libraries.data or {}).get("item_counts", {}),
+            # Enough to recreate each device's entities; playback state is left out
+            "sessions": [s.as_dict(play_state=False) for s in sessions],
+            "device_last_seen": runtime.lifecycle.as_dict() if runtime.lifecycle else {},
+        }
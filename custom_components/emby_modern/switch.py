@@ -6,7 +6,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .entity import EmbyEntity
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddConfigEntryEntitiesCallback) -> None:
-    coordinator = entry.runtime_data
+    coordinator = entry.runtime_data.server
     
     # The courtesy switch is a server-level feature (only one per server)
     async_add_entities([EmbyCourtesySwitch(coordinator)])
@@ -18,12 +18,10 @@ class EmbyCourtesySwitch(EmbyEntity, SwitchEntity):
     
     def __init__(self, coordinator):
         # Attach to the server's device entry
-        ver = coordinator.data.get("system_info", {}).get("Version", "Unknown")
         super().__init__(
             coordinator, 
             device_id=None,
-            client_name="Emby Server", 
-            version=ver
+            client_name="Emby Server"
         )
         self._attr_name = "Shutdown Courtesy Mode"
         self._attr_unique_id = f"{coordinator.entry.unique_id}-courtesy-switch"
@@ -36,6 +34,9 @@ class EmbyCourtesySwitch(EmbyEntity, SwitchEntity):
         # For persistence across HA restarts, this should eventually use entry.options.
         return self._is_on
 
+    def _state_fingerprint(self):
+        return self._is_on
+
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
         self._is_on = True
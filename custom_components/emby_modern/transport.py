@@ -0,0 +1,125 @@
+"""Request scheduling for the Emby client: priority lanes and rate limiting."""
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+
+# Lanes, most urgent first
+PRIORITY_INTERACTIVE = 0  # play/pause, remote keys, messages
+PRIORITY_POLLING = 1      # coordinator refreshes
+PRIORITY_BACKGROUND = 2   # library statistics, media browsing
+
+LANE_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_POLLING: "polling",
+    PRIORITY_BACKGROUND: "background",
+}
+
+
+class TokenBucket:
+    """Token bucket that lets callers book a token ahead and wait for it."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token; returns how long to wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class PriorityLimiter:
+    """Hands out request slots in priority order and paces them with a token bucket.
+
+    `reserved` slots are kept free for the interactive lane, so user commands never
+    queue behind a burst of polling or browsing.
+    """
+
+    def __init__(self, max_concurrent: int, rate: float, burst: int, reserved: int = 1):
+        self._limit = max_concurrent
+        self._reserved = min(reserved, max_concurrent - 1)
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._bucket = TokenBucket(rate, burst)
+        self._lanes = {
+            lane: {"requests": 0, "waiting": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+            for lane in LANE_NAMES.values()
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_POLLING):
+        lane = self._lanes[LANE_NAMES.get(priority, "background")]
+        started = time.monotonic()
+        lane["waiting"] += 1
+        try:
+            await self._acquire(priority)
+        finally:
+            lane["waiting"] -= 1
+        try:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            waited = (time.monotonic() - started) * 1000
+            lane["requests"] += 1
+            lane["wait_ms_total"] += waited
+            lane["wait_ms_max"] = max(lane["wait_ms_max"], waited)
+            yield
+        finally:
+            self._release()
+
+    def _can_start(self, priority: int) -> bool:
+        free = self._limit - self._active
+        return free > (0 if priority == PRIORITY_INTERACTIVE else self._reserved)
+
+    async def _acquire(self, priority: int) -> None:
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        self._wake()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # Granted just as we were cancelled: hand the slot back
+            if fut.done() and not fut.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            priority, _, fut = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_start(priority):
+                break
+            heapq.heappop(self._waiters)
+            self._active += 1
+            fut.set_result(None)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "active": self._active,
+            "limit": self._limit,
+            "lanes": {
+                name: {
+                    "requests": lane["requests"],
+                    "waiting": lane["waiting"],
+                    "avg_wait_ms": round(lane["wait_ms_total"] / lane["requests"], 1) if lane["requests"] else 0.0,
+                    "max_wait_ms": round(lane["wait_ms_max"], 1),
+                }
+                for name, lane in self._lanes.items()
+            },
+        }
@@ -10,9 +10,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .entity import EmbyEntity
+from .transport import PRIORITY_INTERACTIVE
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddConfigEntryEntitiesCallback) -> None:
-    coordinator = entry.runtime_data
+    coordinator = entry.runtime_data.server
     async_add_entities([EmbyServerUpdate(coordinator)])
 
 class EmbyServerUpdate(EmbyEntity, UpdateEntity):
@@ -52,6 +53,9 @@ class EmbyServerUpdate(EmbyEntity, UpdateEntity):
     def in_progress(self) -> bool | int | None:
         return False
 
+    def _state_fingerprint(self):
+        return self.coordinator.data.get("system_info", {}).get("Version")
+
     async def async_install(self, version: str | None, backup: bool, **kwargs: Any) -> None:
         """Install an update (Restart Server to trigger)."""
-        await self.coordinator.client.api_request("POST", "System/Restart")
+        await self.coordinator.client.api_request("POST", "System/Restart", priority=PRIORITY_INTERACTIVE)
@@ -0,0 +1,232 @@
+"""End-to-end benchmark for Emby Modern against the fake Emby server.
+
+Runs the coordinators, browse and entity state calculation against synthetic data
+and reports cycle time, requests and bytes per cycle, browse latency and the cost
+of computing entity state. Requires Home Assistant to be installed.
+
+    python tools/benchmark.py --sessions 200 --libraries 50 --items 500000
+    python tools/benchmark.py --save baseline.json
+    python tools/benchmark.py --compare baseline.json --tolerance 0.25
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.emby_modern.browse_media import async_browse_media, build_content_id  # noqa: E402
+from custom_components.emby_modern.const import DEFAULT_SESSION_ENTITY_TTL  # noqa: E402
+from custom_components.emby_modern.coordinator import (  # noqa: E402
+    EmbyLibraryCoordinator,
+    EmbyRuntimeData,
+    EmbyServerCoordinator,
+    EmbySessionCoordinator,
+)
+from custom_components.emby_modern.emby_client import EmbyClient  # noqa: E402
+from custom_components.emby_modern.lifecycle import SessionEntityLifecycle  # noqa: E402
+from custom_components.emby_modern import media_player  # noqa: E402
+from fake_emby_server import API_KEY, FakeEmbyServer  # noqa: E402
+
+
+class BenchEntry:
+    """Just enough of a ConfigEntry for the coordinators and platforms."""
+
+    def __init__(self, options: dict):
+        self.entry_id = "benchmark"
+        self.unique_id = "benchmark"
+        self.domain = "emby_modern"
+        self.title = "Benchmark"
+        self.data = {}
+        self.options = options
+        self.runtime_data = None
+        # DataUpdateCoordinator reads this when scheduling its next refresh
+        self.pref_disable_polling = False
+        self._on_unload = []
+
+    def async_on_unload(self, func) -> None:
+        self._on_unload.append(func)
+
+    def unload(self) -> None:
+        for func in reversed(self._on_unload):
+            result = func()
+            if asyncio.iscoroutine(result):
+                result.close()
+
+
+def _summary(samples: list[float]) -> dict:
+    """Milliseconds: mean, median, p95 and max of `samples` (seconds)."""
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "mean_ms": round(statistics.fmean(ms), 2),
+        "p50_ms": round(ms[len(ms) // 2], 2),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 2),
+        "max_ms": round(ms[-1], 2),
+    }
+
+
+async def _measure(client: EmbyClient, rounds: int, func) -> dict:
+    """Time `func` over `rounds` runs and count the HTTP traffic it causes."""
+    before = client.request_metrics.totals
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - started)
+    after = client.request_metrics.totals
+    return {
+        **_summary(samples),
+        "requests_per_run": round((after["requests"] - before["requests"]) / rounds, 2),
+        "bytes_per_run": round((after["bytes"] - before["bytes"]) / rounds),
+    }
+
+
+async def run(args) -> dict:
+    server = FakeEmbyServer(args.sessions, args.libraries, args.items, args.channels)
+    runner = await server.start()
+    port = runner.addresses[0][1]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        client = EmbyClient("127.0.0.1", port, API_KEY, False)
+        entry = BenchEntry({})
+        try:
+            await client.validate_connection()
+            runtime = EmbyRuntimeData(
+                client=client,
+                sessions=EmbySessionCoordinator(hass, client, entry),
+                server=EmbyServerCoordinator(hass, client, entry),
+                libraries=EmbyLibraryCoordinator(hass, client, entry),
+            )
+            runtime.lifecycle = SessionEntityLifecycle(
+                hass, entry, runtime.sessions, timedelta(hours=DEFAULT_SESSION_ENTITY_TTL)
+            )
+            entry.runtime_data = runtime
+            results: dict = {"scale": vars(args).copy()}
+            for key in ("save", "compare", "tolerance"):
+                results["scale"].pop(key, None)
+
+            # 1. Coordinator cycles
+            results["sessions_cycle"] = await _measure(client, args.rounds, runtime.sessions.async_refresh)
+            results["server_cycle"] = await _measure(client, args.rounds, runtime.server.async_refresh)
+
+            async def cold_library_cycle():
+                client._handle_cache_clear()
+                await runtime.libraries.async_refresh()
+
+            results["library_cycle_cold"] = await _measure(client, max(args.rounds // 4, 1), cold_library_cycle)
+            results["library_cycle_warm"] = await _measure(client, args.rounds, runtime.libraries.async_refresh)
+
+            # 2. Pushed session lists (what a WebSocket "Sessions" message costs)
+            payload = {"Data": server._sessions}
+
+            async def session_push():
+                runtime.sessions._handle_sessions_push(payload)
+
+            results["sessions_push"] = await _measure(client, args.rounds, session_push)
+
+            # 3. Entity state calculation for every media player
+            players = []
+            await media_player.async_setup_entry(hass, entry, players.extend)
+            for index, player in enumerate(players):
+                player.hass = hass
+                player.entity_id = f"media_player.bench_{index}"
+
+            def calculate(player):
+                # Same work as async_write_ha_state minus the state machine
+                if hasattr(player, "_async_calculate_state"):
+                    return player._async_calculate_state()
+                return player.state, player.state_attributes, player.extra_state_attributes
+
+            async def state_write():
+                for player in players:
+                    calculate(player)
+
+            results["media_player_state"] = {
+                "entities": len(players),
+                **await _measure(client, args.rounds, state_write),
+            }
+
+            # 4. Browse latency (cache cleared each run so the server is hit)
+            library_id = runtime.libraries.data["libraries"][0]["Id"]
+            browse_cases = {
+                "root": (None, None),
+                "library_first_page": ("library", library_id),
+                "library_last_page": ("library", build_content_id(library_id, page=max(server.items_per_library // 100 - 1, 0))),
+                "library_letter": ("library", build_content_id(library_id, letter="M")),
+            }
+            browse = {}
+            for name, (content_type, content_id) in browse_cases.items():
+                async def browse_once(content_type=content_type, content_id=content_id):
+                    client._handle_cache_clear()
+                    await async_browse_media(hass, client, content_type, content_id)
+
+                browse[name] = await _measure(client, args.rounds, browse_once)
+            results["browse"] = browse
+
+            results["server_requests"] = dict(sorted(server.requests.items()))
+            return results
+        finally:
+            entry.unload()
+            for coordinator in entry.runtime_data.coordinators if entry.runtime_data else ():
+                await coordinator.async_shutdown()
+            await client.async_stop()
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a line per benchmark whose mean or request count regressed beyond `tolerance`."""
+    regressions = []
+
+    def walk(current: dict, previous: dict, path: str):
+        for key, value in current.items():
+            old = previous.get(key)
+            if isinstance(value, dict) and isinstance(old, dict):
+                walk(value, old, f"{path}{key}.")
+            elif key in ("mean_ms", "requests_per_run", "bytes_per_run") and isinstance(old, (int, float)) and old > 0:
+                if value > old * (1 + tolerance):
+                    regressions.append(f"{path}{key}: {old} -> {value} (+{(value / old - 1) * 100:.0f}%)")
+
+    walk({k: v for k, v in results.items() if k != "scale"}, baseline, "")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--libraries", type=int, default=50)
+    parser.add_argument("--items", type=int, default=500_000)
+    parser.add_argument("--channels", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="fail if results regress against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, e.g. 0.25 = 25%%")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(json.dumps(results, indent=2))
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2))
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get("scale") != results["scale"]:
+            print("Warning: baseline was recorded at a different scale", file=sys.stderr)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions:\n  " + "\n  ".join(regressions), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
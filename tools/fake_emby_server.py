@@ -0,0 +1,313 @@
+"""Offline stand-in for an Emby server, for benchmarks and manual testing.
+
+Serves the endpoints the integration uses with synthetic data at any scale.
+Items are generated on demand from their index, so 500k items cost no memory
+until they are requested.
+
+    python tools/fake_emby_server.py --sessions 200 --libraries 50 --items 500000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import WSMsgType, web
+
+API_KEY = "benchmark"
+USER_ID = "0123456789abcdef0123456789abcdef"
+SERVER_ID = "fakeemby00000000000000000000000"
+
+COLLECTION_TYPES = ("movies", "tvshows", "music", "homevideos")
+ITEM_TYPES = {"movies": "Movie", "tvshows": "Episode", "music": "Audio", "homevideos": "Video"}
+LIVETV_ID = "9999"
+# Item ids encode their library: <library number> * ID_STRIDE + <index>
+ID_STRIDE = 10_000_000
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeEmbyServer:
+    """Synthetic library, session and Live TV data behind an aiohttp app."""
+
+    def __init__(self, sessions: int = 20, libraries: int = 5, items: int = 5000, channels: int = 30, push_interval: float = 1.0):
+        self.session_count = sessions
+        self.library_count = libraries
+        self.items_per_library = max(items // max(libraries, 1), 1)
+        self.channel_count = channels
+        self.push_interval = push_interval
+        self.requests: dict[str, int] = {}
+        self._sorted_cache: dict[int, list[int]] = {}
+        self._sessions = [self._make_session(i) for i in range(sessions)]
+
+    # --- Data generation ---
+
+    def _library_type(self, lib: int) -> str:
+        return COLLECTION_TYPES[(lib - 1) % len(COLLECTION_TYPES)]
+
+    @staticmethod
+    def _name(index: int) -> str:
+        # Spread names over the alphabet (plus some digits) so A-Z browsing has work to do
+        first = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"[index % 36]
+        return f"{first}{index:07d} Title"
+
+    def _make_item(self, lib: int, index: int, fields: set[str]) -> dict:
+        item_type = ITEM_TYPES[self._library_type(lib)]
+        item = {
+            "Id": str(lib * ID_STRIDE + index),
+            "Name": self._name(index),
+            "Type": item_type,
+            "IsFolder": False,
+            "ProductionYear": 1980 + index % 45,
+            "RunTimeTicks": (20 + index % 100) * 60 * 10_000_000,
+            "ImageTags": {"Primary": f"tag{index}"},
+        }
+        if item_type == "Episode":
+            item.update({"SeriesName": f"Series {index // 100}", "ParentIndexNumber": 1 + index // 20 % 5, "IndexNumber": 1 + index % 20})
+        if "DateCreated" in fields:
+            item["DateCreated"] = (EPOCH + timedelta(minutes=index)).strftime("%Y-%m-%dT%H:%M:%S.0000000Z")
+        if "PremiereDate" in fields:
+            item["PremiereDate"] = f"{item['ProductionYear']}-01-01T00:00:00.0000000Z"
+        if "Overview" in fields:
+            item["Overview"] = "Lorem ipsum dolor sit amet. " * 20
+        return item
+
+    def _make_session(self, index: int) -> dict:
+        session = {
+            "Id": f"{index:032x}",
+            "DeviceId": f"device-{index}",
+            "DeviceName": f"Device {index}",
+            "Client": ("Emby Web", "Emby for Android", "Emby for Samsung", "Emby Theater")[index % 4],
+            "ApplicationVersion": "4.8.0",
+            "DeviceType": ("desktop", "mobile", "tv", "desktop")[index % 4],
+            "UserId": USER_ID,
+            "UserName": f"user{index % 10}",
+            "SupportsRemoteControl": True,
+            "PlayState": {"IsPaused": False, "IsMuted": False, "VolumeLevel": 50, "PositionTicks": 0},
+            "Capabilities": {"PlayableMediaTypes": ["Audio", "Video"], "SupportedCommands": ["MoveUp"] * 40},
+        }
+        # Half of the sessions are playing something
+        if index % 2 == 0:
+            lib = 1 + index % max(self.library_count, 1)
+            session["NowPlayingItem"] = self._make_item(lib, index, {"Overview"})
+        return session
+
+    def _sorted_indexes(self, lib: int) -> list[int]:
+        if lib not in self._sorted_cache:
+            self._sorted_cache[lib] = sorted(range(self.items_per_library), key=self._name)
+        return self._sorted_cache[lib]
+
+    def tick(self) -> None:
+        """Advance playback positions, as a real server's pushes would."""
+        for session in self._sessions:
+            if "NowPlayingItem" in session:
+                session["PlayState"]["PositionTicks"] += int(self.push_interval * 10_000_000)
+
+    # --- HTTP handlers ---
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        token = request.headers.get("X-Emby-Token") or request.query.get("api_key")
+        if token != API_KEY:
+            return web.Response(status=401)
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        self.requests[route] = self.requests.get(route, 0) + 1
+        return await handler(request)
+
+    async def system_info(self, request):
+        return web.json_response({"Id": SERVER_ID, "ServerName": "Fake Emby", "Version": "4.8.0.0"})
+
+    async def sessions(self, request):
+        sessions = self._sessions
+        if "Id" in request.query:
+            sessions = [s for s in sessions if s["Id"] == request.query["Id"]]
+        if "DeviceId" in request.query:
+            sessions = [s for s in sessions if s["DeviceId"] == request.query["DeviceId"]]
+        return web.json_response(sessions)
+
+    async def users(self, request):
+        return web.json_response({"Items": [{"Id": USER_ID, "Name": "admin"}], "TotalRecordCount": 1})
+
+    async def views(self, request):
+        items = [
+            {"Id": str(lib), "Name": f"Library {lib}", "Type": "CollectionFolder", "CollectionType": self._library_type(lib), "IsFolder": True}
+            for lib in range(1, self.library_count + 1)
+        ]
+        if self.channel_count:
+            items.append({"Id": LIVETV_ID, "Name": "Live TV", "Type": "UserView", "CollectionType": "livetv", "IsFolder": True})
+        return web.json_response({"Items": items, "TotalRecordCount": len(items)})
+
+    async def items(self, request):
+        query = request.query
+        fields = set(filter(None, query.get("Fields", "").split(",")))
+        parent = query.get("ParentId", "")
+        if not parent.isdigit() or not 1 <= int(parent) <= self.library_count:
+            return web.json_response({"Items": [], "TotalRecordCount": 0})
+        lib = int(parent)
+
+        if "IncludeItemTypes" in query:
+            wanted = query["IncludeItemTypes"].split(",")
+            if self._library_type(lib) == "tvshows" and wanted == ["Series"]:
+                # Series are not generated as items; count them like Items/Counts does
+                return web.json_response({"Items": [], "TotalRecordCount": (self.items_per_library + 99) // 100})
+            if ITEM_TYPES[self._library_type(lib)] not in wanted:
+                return web.json_response({"Items": [], "TotalRecordCount": 0})
+
+        if query.get("SortBy") == "DateCreated":
+            indexes = range(self.items_per_library - 1, -1, -1)
+        else:
+            indexes = self._sorted_indexes(lib)
+        if "NameStartsWith" in query:
+            prefix = query["NameStartsWith"]
+            indexes = [i for i in indexes if self._name(i).startswith(prefix)]
+        if "NameLessThan" in query:
+            bound = query["NameLessThan"]
+            indexes = [i for i in indexes if self._name(i) < bound]
+        if "NameStartsWithOrGreater" in query:
+            bound = query["NameStartsWithOrGreater"]
+            indexes = [i for i in indexes if self._name(i) >= bound]
+        if "MinDateLastSaved" in query:
+            since = query["MinDateLastSaved"]
+            indexes = [
+                i for i in indexes
+                if (EPOCH + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.0000000Z") >= since
+            ]
+
+        total = len(indexes)
+        start = int(query.get("StartIndex", 0))
+        limit = int(query["Limit"]) if "Limit" in query else total
+        page = [self._make_item(lib, i, fields) for i in list(indexes[start:start + limit])]
+        return web.json_response({"Items": page, "TotalRecordCount": total})
+
+    async def item(self, request):
+        item_id = request.match_info["item_id"]
+        if item_id.isdigit() and 1 <= int(item_id) <= self.library_count:
+            lib = int(item_id)
+            return web.json_response({"Id": item_id, "Name": f"Library {lib}", "Type": "CollectionFolder", "IsFolder": True})
+        if not item_id.isdigit():
+            return web.Response(status=404)
+        lib, index = divmod(int(item_id), ID_STRIDE)
+        return web.json_response(self._make_item(lib, index, set()))
+
+    async def counts(self, request):
+        # Like Emby, Items/Counts has no ParentId filter: always the whole server
+        libs = range(1, self.library_count + 1)
+        counts = {"MovieCount": 0, "SeriesCount": 0, "EpisodeCount": 0, "SongCount": 0}
+        for lib in libs:
+            library_type = self._library_type(lib)
+            if library_type == "movies":
+                counts["MovieCount"] += self.items_per_library
+            elif library_type == "tvshows":
+                counts["EpisodeCount"] += self.items_per_library
+                counts["SeriesCount"] += (self.items_per_library + 99) // 100
+            elif library_type == "music":
+                counts["SongCount"] += self.items_per_library
+        counts["ItemCount"] = self.items_per_library * len(libs)
+        return web.json_response(counts)
+
+    async def channels(self, request):
+        now = datetime.now(timezone.utc)
+        items = [
+            {
+                "Id": f"ch{i}",
+                "Name": f"Channel {i}",
+                "Type": "TvChannel",
+                "CurrentProgram": {"Name": f"Program {i}-{now.hour}"} if request.query.get("AddCurrentProgram", "true") == "true" else None,
+            }
+            for i in range(self.channel_count)
+        ]
+        start = int(request.query.get("StartIndex", 0))
+        limit = int(request.query["Limit"]) if "Limit" in request.query else len(items)
+        return web.json_response({"Items": items[start:start + limit], "TotalRecordCount": len(items)})
+
+    async def programs(self, request):
+        # Half-hour slots on every channel, aligned to the clock
+        def parse(value):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+        now = datetime.now(timezone.utc)
+        start = parse(request.query["MinEndDate"]) if "MinEndDate" in request.query else now
+        end = parse(request.query["MaxStartDate"]) if "MaxStartDate" in request.query else start + timedelta(hours=12)
+        slot = start.replace(minute=0 if start.minute < 30 else 30, second=0, microsecond=0)
+        items = []
+        while slot < end:
+            for i in range(self.channel_count):
+                items.append({
+                    "Id": f"p{i}-{int(slot.timestamp())}",
+                    "Name": f"Program {i}-{slot:%H%M}",
+                    "ChannelId": f"ch{i}",
+                    "StartDate": slot.strftime("%Y-%m-%dT%H:%M:%S.0000000Z"),
+                    "EndDate": (slot + timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M:%S.0000000Z"),
+                })
+            slot += timedelta(minutes=30)
+        first = int(request.query.get("StartIndex", 0))
+        limit = int(request.query["Limit"]) if "Limit" in request.query else len(items)
+        return web.json_response({"Items": items[first:first + limit], "TotalRecordCount": len(items)})
+
+    async def command(self, request):
+        return web.Response(status=204)
+
+    async def websocket(self, request):
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        pusher = None
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                data = json.loads(msg.data)
+                if data.get("MessageType") == "SessionsStart" and pusher is None:
+                    pusher = asyncio.create_task(self._push_sessions(ws))
+        finally:
+            if pusher:
+                pusher.cancel()
+        return ws
+
+    async def _push_sessions(self, ws: web.WebSocketResponse):
+        while not ws.closed:
+            self.tick()
+            await ws.send_json({"MessageType": "Sessions", "Data": self._sessions})
+            await asyncio.sleep(self.push_interval)
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/System/Info", self.system_info)
+        app.router.add_get("/Sessions", self.sessions)
+        app.router.add_get("/Users", self.users)
+        app.router.add_get("/Users/{user_id}/Views", self.views)
+        app.router.add_get("/Users/{user_id}/Items", self.items)
+        app.router.add_get("/Users/{user_id}/Items/{item_id}", self.item)
+        app.router.add_get("/Items/Counts", self.counts)
+        app.router.add_get("/LiveTv/Channels", self.channels)
+        app.router.add_get("/LiveTv/Programs", self.programs)
+        app.router.add_post("/Sessions/{session_id}/{path:.*}", self.command)
+        app.router.add_delete("/Sessions/{session_id}", self.command)
+        app.router.add_post("/System/{action}", self.command)
+        app.router.add_post("/Library/Refresh", self.command)
+        app.router.add_get("/embywebsocket", self.websocket)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> web.AppRunner:
+        """Start serving in the running loop; returns the runner (port in runner.addresses)."""
+        runner = web.AppRunner(self.make_app())
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8096)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--libraries", type=int, default=50)
+    parser.add_argument("--items", type=int, default=500_000)
+    parser.add_argument("--channels", type=int, default=30)
+    args = parser.parse_args()
+
+    server = FakeEmbyServer(args.sessions, args.libraries, args.items, args.channels)
+    print(f"Fake Emby on http://{args.host}:{args.port} (API key: {API_KEY})")
+    web.run_app(server.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()